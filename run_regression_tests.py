@@ -4,9 +4,12 @@ Local test runner for regression and safety tests.
 
 Usage:
     python run_regression_tests.py [--quick] [--full] [--security] [--performance]
+                                   [--workers N] [--reinstall]
 """
 
 import argparse
+import importlib.metadata
+import importlib.util
 import subprocess
 import sys
 import time
@@ -22,30 +25,72 @@ def run_command(cmd, description, continue_on_error=False):
 
     start_time = time.time()
 
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        duration = time.time() - start_time
+    # Stream output as it is produced instead of buffering it until exit
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    )
+    for line in proc.stdout:
+        sys.stdout.write(line)
+    returncode = proc.wait()
+    duration = time.time() - start_time
 
+    if returncode == 0:
         print(f"✅ {description} PASSED ({duration:.1f}s)")
-        if result.stdout:
-            print(f"Output:\n{result.stdout}")
-
         return True
 
-    except subprocess.CalledProcessError as e:
-        duration = time.time() - start_time
+    if continue_on_error:
+        print(f"⚠️  {description} FAILED ({duration:.1f}s) - continuing...")
+    else:
+        print(f"❌ {description} FAILED ({duration:.1f}s)")
+
+    return not continue_on_error
+
 
-        if continue_on_error:
-            print(f"⚠️  {description} FAILED ({duration:.1f}s) - continuing...")
-        else:
-            print(f"❌ {description} FAILED ({duration:.1f}s)")
+def parallel_args(workers):
+    """Build pytest-xdist arguments for suites that can run in parallel.
+
+    Returns an empty list when parallelism is disabled or pytest-xdist is not
+    installed, so the suites still run (serially) in minimal environments.
+    """
+    if workers == "0" or importlib.util.find_spec("xdist") is None:
+        return []
+    return ["-n", workers, "--dist=loadfile"]
+
+
+def package_installed():
+    """Check whether the package is installed in the current environment.
+
+    Uses the distribution metadata rather than an import check, since the
+    package directory sits next to this script and is always importable.
+    """
+    try:
+        importlib.metadata.distribution("swarm-provenance-mcp")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
 
-        if e.stdout:
-            print(f"Output:\n{e.stdout}")
-        if e.stderr:
-            print(f"Error:\n{e.stderr}")
 
-        return not continue_on_error
+def slugify(label):
+    """Turn a suite label into a file-name friendly slug."""
+    return label.lower().replace(" ", "_")
+
+
+def group_suites(suites):
+    """Group suites that share pytest flags so they run in a single process.
+
+    Args:
+        suites: Iterable of (label, paths, marker_args, parallel) tuples
+
+    Returns:
+        List of ((marker_args, parallel), labels, paths) groups in first-seen order
+    """
+    groups = {}
+    for label, paths, marker_args, parallel in suites:
+        key = (tuple(marker_args), parallel)
+        labels, group_paths = groups.setdefault(key, ([], []))
+        labels.append(label)
+        group_paths.extend(path for path in paths if path not in group_paths)
+    return [(key, labels, paths) for key, (labels, paths) in groups.items()]
 
 
 def main():
@@ -62,98 +107,90 @@ def main():
                        help="Run integration tests (requires gateway)")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Verbose output")
+    parser.add_argument("--workers", default="auto",
+                       help="pytest-xdist worker count ('auto', a number, or 0 to run serially)")
+    parser.add_argument("--reinstall", action="store_true",
+                       help="Reinstall the package in editable mode before testing")
 
     args = parser.parse_args()
 
     # Change to project directory
     project_dir = Path(__file__).parent
-    subprocess.run(["pip", "install", "-e", "."], cwd=project_dir, check=True)
+    if args.reinstall or not package_installed():
+        subprocess.run(
+            ["pip", "install", "-e", ".", "--no-deps", "--no-build-isolation"],
+            cwd=project_dir, check=True,
+        )
 
-    base_cmd = ["python", "-m", "pytest"]
+    base_cmd = ["python", "-m", "pytest", "-p", "no:cacheprovider"]
     if args.verbose:
         base_cmd.extend(["-v", "--tb=short"])
 
-    success_count = 0
-    total_tests = 0
-
     print("🧪 Starting Regression Test Suite")
     print(f"Project directory: {project_dir}")
 
+    # Each suite is (label, paths, marker args, parallel-safe)
+    suites = []
+
     # Quick smoke tests
     if args.quick or not any([args.full, args.security, args.performance, args.integration]):
-        total_tests += 1
-        if run_command(
-            base_cmd + ["tests/test_schema_compliance.py::TestMCPToolSchemaCompliance::test_all_tools_have_valid_json_schemas"],
+        suites.append((
             "Quick Schema Validation",
-            continue_on_error=True
-        ):
-            success_count += 1
-
-        total_tests += 1
-        if run_command(
-            base_cmd + ["tests/test_security_safety.py::TestInputValidationSecurity::test_upload_data_injection_protection"],
+            ["tests/test_schema_compliance.py::TestMCPToolSchemaCompliance::test_all_tools_have_valid_json_schemas"],
+            [], True,
+        ))
+        suites.append((
             "Quick Security Check",
-            continue_on_error=True
-        ):
-            success_count += 1
+            ["tests/test_security_safety.py::TestInputValidationSecurity::test_upload_data_injection_protection"],
+            [], True,
+        ))
 
     # Security tests
     if args.security or args.full:
-        total_tests += 1
-        if run_command(
-            base_cmd + ["tests/test_security_safety.py"],
-            "Security and Safety Tests",
-            continue_on_error=True
-        ):
-            success_count += 1
+        suites.append(("Security and Safety Tests", ["tests/test_security_safety.py"], [], True))
 
     # Performance tests
     if args.performance or args.full:
-        total_tests += 1
-        if run_command(
-            base_cmd + ["tests/test_performance_regression.py", "-m", "not slow"],
+        suites.append((
             "Performance Baseline Tests",
-            continue_on_error=True
-        ):
-            success_count += 1
+            ["tests/test_performance_regression.py"], ["-m", "not slow"], True,
+        ))
 
         if args.full:
-            total_tests += 1
-            if run_command(
-                base_cmd + ["tests/test_performance_regression.py", "-m", "slow"],
+            # Sustained load tests measure timing, so they never share workers
+            suites.append((
                 "Sustained Load Tests",
-                continue_on_error=True
-            ):
-                success_count += 1
+                ["tests/test_performance_regression.py"], ["-m", "slow"], False,
+            ))
 
     # Schema compliance
     if args.full or not args.quick:
-        total_tests += 1
-        if run_command(
-            base_cmd + ["tests/test_schema_compliance.py"],
-            "Schema Compliance Tests",
-            continue_on_error=True
-        ):
-            success_count += 1
+        suites.append(("Schema Compliance Tests", ["tests/test_schema_compliance.py"], [], True))
 
     # Integration tests
     if args.integration or args.full:
-        total_tests += 1
-        if run_command(
-            base_cmd + ["tests/test_integration_smoke.py"],
-            "Integration Smoke Tests",
-            continue_on_error=True
-        ):
-            success_count += 1
+        suites.append(("Integration Smoke Tests", ["tests/test_integration_smoke.py"], [], True))
 
     # Standard unit tests
     if args.full:
-        total_tests += 1
-        if run_command(
-            base_cmd + ["tests/test_tool_execution.py", "tests/test_tool_definitions.py"],
+        suites.append((
             "Core Unit Tests",
-            continue_on_error=True
-        ):
+            ["tests/test_tool_execution.py", "tests/test_tool_definitions.py"], [], True,
+        ))
+
+    success_count = 0
+    total_tests = 0
+
+    # One pytest process per distinct set of flags instead of one per suite
+    for (marker_args, parallel), labels, paths in group_suites(suites):
+        cmd = list(base_cmd)
+        if parallel:
+            cmd += parallel_args(args.workers)
+        cmd += paths + list(marker_args)
+        cmd.append(f"--junitxml=results_{'_'.join(slugify(label) for label in labels)}.xml")
+
+        total_tests += 1
+        if run_command(cmd, " + ".join(labels), continue_on_error=True):
             success_count += 1
 
     # Summary
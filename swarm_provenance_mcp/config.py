@@ -1,9 +1,10 @@
 """Configuration management for the Swarm Provenance MCP server."""
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -29,6 +30,13 @@ class Settings(BaseSettings):
         description="Default depth for new postage stamps"
     )
 
+    # Upload behaviour
+    pre_validate_stamp: bool = Field(
+        default=True,
+        env="PRE_VALIDATE_STAMP",
+        description="Check the stamp alongside each upload to report unusable stamps clearly"
+    )
+
     # MCP Server Configuration
     mcp_server_name: str = Field(
         default="swarm-provenance-mcp",
@@ -42,10 +50,21 @@ class Settings(BaseSettings):
         description="Version of the MCP server"
     )
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the global settings instance, loading it on first use.
+
+    Parsing ``.env`` and the environment is deferred until something actually
+    needs a setting, so importing the package stays cheap.
+    """
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy module-level ``settings`` attribute lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
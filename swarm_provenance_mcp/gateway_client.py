@@ -1,11 +1,85 @@
 """Client for communicating with the swarm_connect FastAPI gateway."""
 
+import atexit
+import functools
 import json
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, Iterator, List, Any, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+from .config import get_settings
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "fast" extra
+    orjson = None
+
+__all__ = ["SwarmGatewayClient", "default_headers", "get_gateway_client", "loads_json"]
+
+# Connection pool sizing. Tool handlers run gateway calls in executor threads,
+# so several requests can be in flight at once; keep enough idle keep-alive
+# connections around that concurrent calls don't have to redo the TLS handshake.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+# Read size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Retry transient gateway failures on the warm pooled connection. Only GETs are
+# retried on 5xx/read errors: purchase (POST) and extend (PATCH) spend funds and
+# must never be replayed. Connection failures are not retried so an unreachable
+# gateway is reported immediately. raise_on_status=False hands the final 5xx
+# back to raise_for_status(), keeping the HTTPError (and its response) intact.
+RETRY_POLICY = Retry(
+    total=3,
+    connect=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# orjson turns integers wider than 64 bits (stamp amounts are wei/PLUR) into
+# floats without raising, so bodies with that many digits in a row are left
+# to the stdlib parser
+_WIDE_DIGITS = re.compile(rb"\d{20}")
+
+
+def loads_json(body: bytes) -> Any:
+    """Parse a JSON document, using orjson when it can do so exactly.
+
+    Bodies orjson rejects (NaN, Infinity) or would round (integers wider
+    than 64 bits) are parsed with the stdlib ``json`` module instead.
+
+    Args:
+        body: Raw JSON bytes
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        ValueError: If the body is not valid UTF-8 JSON
+    """
+    if orjson is not None and not _WIDE_DIGITS.search(body):
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
 
-from .config import settings
+@functools.lru_cache(maxsize=1)
+def default_headers() -> Dict[str, str]:
+    """Headers sent with every gateway request, built once per process."""
+    settings = get_settings()
+    return {
+        "Content-Type": "application/json",
+        "User-Agent": f"{settings.mcp_server_name}/{settings.mcp_server_version}",
+    }
 
 
 class SwarmGatewayClient:
@@ -17,12 +91,37 @@ class SwarmGatewayClient:
         Args:
             base_url: Override the default gateway URL from settings
         """
-        self.base_url = (base_url or settings.swarm_gateway_url).rstrip("/")
+        self.base_url = (base_url or get_settings().swarm_gateway_url).rstrip("/")
         self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": f"{settings.mcp_server_name}/{settings.mcp_server_version}"
-        })
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=RETRY_POLICY,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(default_headers())
+
+    def _json(self, response: requests.Response) -> Any:
+        """Decode a JSON response body with :func:`loads_json`.
+
+        Args:
+            response: Successful gateway response
+
+        Returns:
+            Decoded JSON, or an empty dict for an empty body
+
+        Raises:
+            RequestException: If the body is not valid JSON
+        """
+        if not response.content:
+            return {}
+        try:
+            return loads_json(response.content)
+        except ValueError:
+            # Defer to requests so callers still get its JSONDecodeError,
+            # which is a RequestException
+            return response.json()
 
     def purchase_stamp(
         self,
@@ -53,7 +152,7 @@ class SwarmGatewayClient:
 
         response = self.session.post(url, json=payload, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def get_stamp_details(self, stamp_id: str) -> Dict[str, Any]:
         """Get details for a specific stamp.
@@ -70,7 +169,7 @@ class SwarmGatewayClient:
         url = f"{self.base_url}/api/v1/stamps/{stamp_id}"
         response = self.session.get(url, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def list_stamps(self) -> Dict[str, Any]:
         """List all available stamps.
@@ -84,7 +183,7 @@ class SwarmGatewayClient:
         url = f"{self.base_url}/api/v1/stamps/"
         response = self.session.get(url, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def extend_stamp(self, stamp_id: str, amount: int) -> Dict[str, Any]:
         """Extend an existing stamp with additional funds.
@@ -104,14 +203,19 @@ class SwarmGatewayClient:
 
         response = self.session.patch(url, json=payload, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
 
-    def upload_data(self, data: str, stamp_id: str, content_type: str = "application/json") -> Dict[str, Any]:
+    def upload_data(
+        self,
+        data: Union[str, bytes],
+        stamp_id: str,
+        content_type: str = "application/json"
+    ) -> Dict[str, Any]:
         """Upload data to Swarm network.
 
         Args:
-            data: Data content as string (max 4096 bytes)
+            data: Data content as string or already-encoded bytes (max 4096 bytes)
             stamp_id: Postage stamp ID to use for upload
             content_type: MIME type of the content (default: application/json)
 
@@ -123,7 +227,7 @@ class SwarmGatewayClient:
             ValueError: If data exceeds size limit
         """
         # Check size limit (4KB = 4096 bytes)
-        data_bytes = data.encode('utf-8')
+        data_bytes = data if isinstance(data, (bytes, bytearray)) else data.encode('utf-8')
         if len(data_bytes) > 4096:
             raise ValueError(f"Data size {len(data_bytes)} bytes exceeds 4KB limit (4096 bytes). Larger uploads are not currently supported.")
 
@@ -139,16 +243,14 @@ class SwarmGatewayClient:
             'content_type': content_type
         }
 
-        # For file uploads, temporarily remove Content-Type from session to let requests set multipart/form-data
-        original_content_type = self.session.headers.pop('Content-Type', None)
-        try:
-            response = self.session.post(url, files=files, params=params, timeout=30)
-        finally:
-            # Restore the Content-Type header
-            if original_content_type:
-                self.session.headers['Content-Type'] = original_content_type
+        # Drop the session's JSON Content-Type for this request only so requests can
+        # set the multipart boundary. The session itself is shared between threads,
+        # so its headers must not be mutated here.
+        response = self.session.post(
+            url, files=files, params=params, headers={"Content-Type": None}, timeout=30
+        )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def download_data(self, reference: str) -> bytes:
         """Download data from Swarm network.
@@ -159,13 +261,34 @@ class SwarmGatewayClient:
         Returns:
             Raw data bytes
 
+        Raises:
+            RequestException: If the request fails
+        """
+        return b"".join(self.download_data_stream(reference))
+
+    def download_data_stream(
+        self, reference: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Download data from Swarm network in chunks.
+
+        The response body is read as it arrives instead of being buffered
+        whole by requests, and the connection goes back to the pool once
+        the generator is exhausted or closed.
+
+        Args:
+            reference: Swarm reference hash of the data
+            chunk_size: Maximum size of each yielded chunk in bytes
+
+        Yields:
+            Raw data chunks
+
         Raises:
             RequestException: If the request fails
         """
         url = f"{self.base_url}/api/v1/data/{reference}"
-        response = self.session.get(url, timeout=30)
-        response.raise_for_status()
-        return response.content
+        with self.session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
 
     def health_check(self) -> Dict[str, Any]:
         """Check gateway and Swarm connectivity.
@@ -181,7 +304,7 @@ class SwarmGatewayClient:
         response.raise_for_status()
 
         # Create meaningful health status
-        health_data = response.json() if response.content else {}
+        health_data = self._json(response)
         return {
             "status": "healthy",
             "gateway_url": self.base_url,
@@ -191,4 +314,20 @@ class SwarmGatewayClient:
 
     def close(self):
         """Close the HTTP session."""
-        self.session.close()
\ No newline at end of file
+        self.session.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_gateway_client() -> SwarmGatewayClient:
+    """Return the process-wide gateway client, creating it on first use.
+
+    Sharing one client means every caller reuses the same connection pool
+    instead of paying a fresh TCP/TLS handshake. Callers must not close the
+    returned instance; it is closed automatically at interpreter exit.
+
+    Returns:
+        The shared SwarmGatewayClient configured from settings
+    """
+    client = SwarmGatewayClient()
+    atexit.register(client.close)
+    return client
@@ -1,11 +1,19 @@
 """MCP server implementation for Swarm stamp management."""
 
 import asyncio
+import functools
+import inspect
 import json
 import logging
-import re
-from typing import Any, Dict, List, Optional, Sequence
-
+import queue
+import string
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import jsonschema
+from jsonschema.exceptions import best_match
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -18,45 +26,133 @@ from mcp.types import (
 )
 from requests.exceptions import RequestException
 
-from .config import settings
-from .gateway_client import SwarmGatewayClient
+from .config import get_settings
+from .gateway_client import SwarmGatewayClient, get_gateway_client, loads_json
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "fast" extra
+    orjson = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global gateway client instance
-gateway_client = SwarmGatewayClient()
+# Signature shared by every tool handler
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[CallToolResult]]
 
-# Validation patterns
-STAMP_ID_PATTERN = re.compile(r"^[a-fA-F0-9]{64}$")
-REFERENCE_HASH_PATTERN = re.compile(r"^[a-fA-F0-9]{64}$")
 
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            # e.g. stamp amounts wider than 64 bits, which orjson can't encode
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Gateway client used by the tool handlers. Created on first use by
+# _get_client(), so importing this module opens no HTTP session.
+gateway_client: Optional[SwarmGatewayClient] = None
+
+
+def _get_client() -> SwarmGatewayClient:
+    """Return the gateway client used by the tool handlers.
+
+    Handlers must always go through this instead of constructing a
+    ``SwarmGatewayClient`` themselves: the shared client's pooled session
+    keeps gateway connections alive across tool calls and is closed once
+    at shutdown.
+    """
+    global gateway_client
+    if gateway_client is None:
+        gateway_client = get_gateway_client()
+    return gateway_client
+
+
+# Upper bound on items per *_batch tool call; each item is one gateway request
+MAX_BATCH_ITEMS = 20
+
+# Stamp purchase/extension limits, shared by the validators and tool schemas
+MIN_STAMP_AMOUNT = 1_000_000
+MIN_STAMP_DEPTH = 16
+MAX_STAMP_DEPTH = 24
+
+# Row of the list_stamps table: Batch ID | Expiration | Status
+_STAMP_ROW = "{:<20} | {:<20} | {:<10}\n".format
+_STAMP_TABLE_HEADER = (
+    _STAMP_ROW("Batch ID", "Expiration", "Status")
+    + _STAMP_ROW("-" * 20, "-" * 20, "-" * 10)
+)
+
+# Status column values for the list_stamps table
+_STATUS_USABLE = "✅ Usable"
+_STATUS_EXPIRED = "❌ Expired"
+_STATUS_UNKNOWN = "❓ Unknown"
+
+# Opening lines of the success responses
+_PURCHASE_HEADER = "🎉 Stamp purchased successfully!\n\n📋 Your Stamp Details:\n"
+_EXTEND_HEADER = "✅ Stamp extended successfully!\n\n📋 Extension Details:\n"
+_UPLOAD_HEADER = "🎉 Data uploaded successfully to Swarm!\n\n📄 Upload Details:\n"
+
+# Stamp batch IDs and Swarm reference hashes are both 64 hex characters.
+# Translating through this table deletes every hex digit, leaving only
+# invalid characters behind.
+_HEX_LENGTH = 64
+_DROP_HEX_DIGITS = dict.fromkeys(map(ord, string.hexdigits))
+
+# Format errors end with the rejected value, appended only when raising
+_BAD_STAMP_MSG = (
+    "Invalid stamp ID format. "
+    "Expected 64-character hexadecimal string (without 0x prefix), got: "
+)
+_BAD_REFERENCE_MSG = (
+    "Invalid reference hash format. "
+    "Expected 64-character hexadecimal string (without 0x prefix), got: "
+)
 
-def validate_and_clean_stamp_id(stamp_id: str) -> str:
-    """Validate and clean stamp ID, removing 0x prefix if present.
+
+def _validate_hex64(value: str, kind: str, invalid_msg: str) -> str:
+    """Validate and clean a 64-character hex identifier, removing 0x prefix if present.
 
     Args:
-        stamp_id: The stamp ID to validate
+        value: The identifier to validate
+        kind: Label used in the empty-value error, e.g. "Stamp ID"
+        invalid_msg: Format error prefix, completed with the cleaned value
 
     Returns:
-        Cleaned stamp ID without 0x prefix
+        Cleaned identifier without 0x prefix
 
     Raises:
-        ValueError: If stamp ID format is invalid
+        ValueError: If the identifier format is invalid
     """
-    if not stamp_id:
-        raise ValueError("Stamp ID cannot be empty")
+    if not value:
+        raise ValueError(f"{kind} cannot be empty")
 
     # Remove 0x prefix if present
-    if stamp_id.startswith("0x") or stamp_id.startswith("0X"):
-        stamp_id = stamp_id[2:]
+    if value.startswith(("0x", "0X")):
+        value = value[2:]
 
     # Validate format
-    if not STAMP_ID_PATTERN.match(stamp_id):
-        raise ValueError(f"Invalid stamp ID format. Expected 64-character hexadecimal string (without 0x prefix), got: {stamp_id}")
+    if len(value) != _HEX_LENGTH or value.translate(_DROP_HEX_DIGITS):
+        raise ValueError(invalid_msg + value)
+
+    return value
+
 
-    return stamp_id
+def validate_and_clean_stamp_id(stamp_id: str) -> str:
+    """Validate and clean stamp ID, removing 0x prefix if present.
+
+    Args:
+        stamp_id: The stamp ID to validate
+
+    Returns:
+        Cleaned stamp ID without 0x prefix
+
+    Raises:
+        ValueError: If stamp ID format is invalid
+    """
+    return _validate_hex64(stamp_id, "Stamp ID", _BAD_STAMP_MSG)
 
 
 def validate_and_clean_reference_hash(reference: str) -> str:
@@ -71,18 +167,7 @@ def validate_and_clean_reference_hash(reference: str) -> str:
     Raises:
         ValueError: If reference hash format is invalid
     """
-    if not reference:
-        raise ValueError("Reference hash cannot be empty")
-
-    # Remove 0x prefix if present
-    if reference.startswith("0x") or reference.startswith("0X"):
-        reference = reference[2:]
-
-    # Validate format
-    if not REFERENCE_HASH_PATTERN.match(reference):
-        raise ValueError(f"Invalid reference hash format. Expected 64-character hexadecimal string (without 0x prefix), got: {reference}")
-
-    return reference
+    return _validate_hex64(reference, "Reference hash", _BAD_REFERENCE_MSG)
 
 
 def validate_stamp_amount(amount: int) -> None:
@@ -94,8 +179,8 @@ def validate_stamp_amount(amount: int) -> None:
     Raises:
         ValueError: If amount is invalid
     """
-    if amount < 1000000:
-        raise ValueError(f"Stamp amount must be at least 1,000,000 wei, got: {amount}")
+    if amount < MIN_STAMP_AMOUNT:
+        raise ValueError(f"Stamp amount must be at least {MIN_STAMP_AMOUNT:,} wei, got: {amount}")
 
 
 def validate_stamp_depth(depth: int) -> None:
@@ -107,187 +192,403 @@ def validate_stamp_depth(depth: int) -> None:
     Raises:
         ValueError: If depth is invalid
     """
-    if not (16 <= depth <= 24):
-        raise ValueError(f"Stamp depth must be between 16 and 24, got: {depth}")
+    if not (MIN_STAMP_DEPTH <= depth <= MAX_STAMP_DEPTH):
+        raise ValueError(f"Stamp depth must be between {MIN_STAMP_DEPTH} and {MAX_STAMP_DEPTH}, got: {depth}")
 
 
-def validate_data_size(data: str) -> None:
+def validate_data_size(data: Union[str, bytes]) -> bytes:
     """Validate data size for upload.
 
     Args:
-        data: The data to validate
+        data: The data to validate, as text or already UTF-8 encoded bytes
+
+    Returns:
+        The UTF-8 encoded data, ready to upload
 
     Raises:
         ValueError: If data size is invalid
     """
-    data_bytes = data.encode('utf-8')
+    data_bytes = data if isinstance(data, bytes) else data.encode('utf-8')
     if len(data_bytes) > 4096:
         raise ValueError(f"Data size {len(data_bytes)} bytes exceeds 4KB limit (4096 bytes)")
     if len(data_bytes) == 0:
         raise ValueError("Data cannot be empty")
+    return data_bytes
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking gateway call in the default executor.
+
+    The gateway client is built on ``requests``; running its calls off the
+    event loop lets concurrent tool invocations overlap instead of queueing
+    behind each other's HTTP round-trips.
+
+    Args:
+        func: Blocking callable, typically a ``gateway_client`` method
+        *args: Positional arguments for ``func``
+
+    Returns:
+        Whatever ``func`` returns
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+def _batch_schema(tool: Tool, description: str) -> Dict[str, Any]:
+    """Build the input schema of a batched tool from its single-item tool.
+
+    Args:
+        tool: The single-item tool whose arguments each batch item takes
+        description: Description of the ``items`` parameter
+
+    Returns:
+        JSON schema accepting ``{"items": [<tool arguments>, ...]}``
+    """
+    return {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "description": description,
+                "items": tool.inputSchema,
+                "minItems": 1,
+                "maxItems": MAX_BATCH_ITEMS
+            }
+        },
+        "required": ["items"]
+    }
+
+
+def _build_tools() -> List[Tool]:
+    """Return the tool definitions advertised to MCP clients.
+
+    The list only depends on the default stamp settings, so it is built on
+    the first ``ListTools`` request and the same objects are returned until
+    those settings change.
+    """
+    settings = get_settings()
+    return _tools_for_defaults(settings.default_stamp_amount, settings.default_stamp_depth)
+
+
+@functools.lru_cache(maxsize=4)
+def _tools_for_defaults(default_amount: int, default_depth: int) -> List[Tool]:
+    """Build the tool definitions for the given default stamp parameters."""
+    tools = [
+        Tool(
+            name="purchase_stamp",
+            description="Purchase a new Swarm postage stamp. Returns a 64-character hexadecimal batch ID (without 0x prefix) that can be used for uploading data to Swarm. AGENT GUIDANCE: Celebrate the success and provide next steps. Emphasize that it takes ~1 minute for stamp info to be available on blockchain. Suggest using it for only one file upload (max 4KB), then purchase another stamp for the next upload.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "amount": {
+                        "type": "integer",
+                        "description": f"Amount of the stamp in wei. Higher amounts provide longer TTL (time-to-live) before stamp expires (default: {default_amount})",
+                        "default": default_amount,
+                        "minimum": MIN_STAMP_AMOUNT
+                    },
+                    "depth": {
+                        "type": "integer",
+                        "description": f"Depth of the stamp (16-24). Depth determines storage capacity - higher depth allows storing more chunks (default: {default_depth})",
+                        "default": default_depth,
+                        "minimum": MIN_STAMP_DEPTH,
+                        "maximum": MAX_STAMP_DEPTH
+                    },
+                    "label": {
+                        "type": "string",
+                        "description": "Optional human-readable label for easier stamp identification",
+                        "maxLength": 100
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="get_stamp_status",
+            description="Get detailed information about a specific stamp including TTL, expiration time, utilization, and usability status. Essential for checking if a stamp is still valid for uploads. AGENT GUIDANCE: Present results with expiration time and usability status highlighted. If stamp is near expiration or unusable, emphasize this to the user.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "stamp_id": {
+                        "type": "string",
+                        "description": "The 64-character hexadecimal batch ID of the stamp (without 0x prefix). Example: a1b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789a",
+                        "pattern": "^[a-fA-F0-9]{64}$"
+                    }
+                },
+                "required": ["stamp_id"]
+            }
+        ),
+        Tool(
+            name="list_stamps",
+            description="List all available postage stamps with their details including batch IDs, amounts, depths, TTL, expiration times, and utilization. Shows both local stamps (owned by this node) and network stamps. AGENT GUIDANCE: Present as a table with columns: Batch ID, Expiration Time, Status. Do not categorize or give recommendations. Note that this might return a long list and may be removed in future versions.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "description": "Output format: 'table' for a readable summary table, or 'json' for the full stamp records as JSON",
+                        "enum": ["table", "json"],
+                        "default": "table"
+                    },
+                    "summary": {
+                        "type": "boolean",
+                        "description": "Return only the total stamp count instead of the stamp records",
+                        "default": False
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of stamps to skip before the first one returned",
+                        "minimum": 0,
+                        "default": 0
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of stamps to return (all remaining stamps when omitted)",
+                        "minimum": 1
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="extend_stamp",
+            description="Extend an existing stamp with additional funds to increase its TTL (time-to-live). This extends the expiration date but does NOT increase storage capacity. The stamp must be owned by this node. AGENT GUIDANCE: Show before/after comparison if possible. Note that extension info takes time to propagate through blockchain - suggest user to check stamp status again in ~1 minute to see new expiration time.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "stamp_id": {
+                        "type": "string",
+                        "description": "The 64-character hexadecimal batch ID of the stamp to extend (without 0x prefix). Example: a1b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789a",
+                        "pattern": "^[a-fA-F0-9]{64}$"
+                    },
+                    "amount": {
+                        "type": "integer",
+                        "description": "Additional amount to add to the stamp in wei. This will extend the stamp's TTL proportionally.",
+                        "minimum": MIN_STAMP_AMOUNT
+                    }
+                },
+                "required": ["stamp_id", "amount"]
+            }
+        ),
+        Tool(
+            name="upload_data",
+            description="Upload data to the Swarm network using a valid postage stamp. Supports files up to 4KB. Checks that the stamp is usable on this gateway while the upload runs. Returns a Swarm reference hash for retrieving the data. AGENT GUIDANCE: Celebrate successful upload and provide retrieval instructions. Show how to copy the reference hash for later data retrieval.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "data": {
+                        "type": "string",
+                        "description": "Data content to upload as a string (max 4096 bytes). Can be JSON, text, or any string data.",
+                        "maxLength": 4096
+                    },
+                    "stamp_id": {
+                        "type": "string",
+                        "description": "64-character hexadecimal batch ID of the postage stamp (without 0x prefix). Example: a1b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789a",
+                        "pattern": "^[a-fA-F0-9]{64}$"
+                    },
+                    "content_type": {
+                        "type": "string",
+                        "description": "MIME type of the content (e.g., application/json, text/plain, image/png)",
+                        "default": "application/json"
+                    }
+                },
+                "required": ["data", "stamp_id"]
+            }
+        ),
+        Tool(
+            name="download_data",
+            description="Download data from the Swarm network using a reference hash. Returns the raw data content. For binary data, size and type information is provided instead of content. AGENT GUIDANCE: Present content appropriately - for JSON data, show field names and truncate long fields to one line. For binary data, explain what it is and how to save it.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "reference": {
+                        "type": "string",
+                        "description": "64-character hexadecimal Swarm reference hash (without 0x prefix). Example: b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789ab",
+                        "pattern": "^[a-fA-F0-9]{64}$"
+                    }
+                },
+                "required": ["reference"]
+            }
+        ),
+        Tool(
+            name="health_check",
+            description="Check gateway and Swarm network connectivity status. Returns gateway URL, response time, and connection status. Useful for troubleshooting connectivity issues. AGENT GUIDANCE: Show simple 'all good' vs 'issues detected' status. If problems found, suggest checking the gateway server at the URL provided.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
+    ]
+
+    # Batched variants take a list of the single tool's arguments and run
+    # the items concurrently, returning one combined result
+    single = {tool.name: tool for tool in tools}
+    tools += [
+        Tool(
+            name="purchase_stamp_batch",
+            description=f"Purchase several Swarm postage stamps in one call (up to {MAX_BATCH_ITEMS}). Each item takes the same arguments as purchase_stamp and the purchases run concurrently. Returns one section per item, in order, marked as succeeded or failed.",
+            inputSchema=_batch_schema(single["purchase_stamp"], "Stamps to purchase, each with the purchase_stamp arguments")
+        ),
+        Tool(
+            name="get_stamp_status_batch",
+            description=f"Get the status of several stamps in one call (up to {MAX_BATCH_ITEMS}). Each item takes the same arguments as get_stamp_status and the lookups run concurrently. Returns one section per item, in order, marked as succeeded or failed.",
+            inputSchema=_batch_schema(single["get_stamp_status"], "Stamps to look up, each with the get_stamp_status arguments")
+        ),
+        Tool(
+            name="extend_stamp_batch",
+            description=f"Extend several stamps in one call (up to {MAX_BATCH_ITEMS}). Each item takes the same arguments as extend_stamp and the extensions run concurrently. Returns one section per item, in order, marked as succeeded or failed.",
+            inputSchema=_batch_schema(single["extend_stamp"], "Stamps to extend, each with the extend_stamp arguments")
+        ),
+        Tool(
+            name="upload_data_batch",
+            description=f"Upload several pieces of data to Swarm in one call (up to {MAX_BATCH_ITEMS}). Each item takes the same arguments as upload_data (max 4KB each) and the uploads run concurrently. Returns one section per item, in order, with its reference hash or error.",
+            inputSchema=_batch_schema(single["upload_data"], "Data to upload, each with the upload_data arguments")
+        ),
+        Tool(
+            name="download_data_batch",
+            description=f"Download several Swarm references in one call (up to {MAX_BATCH_ITEMS}). Each item takes the same arguments as download_data and the downloads run concurrently. Returns one section per item, in order, with its content or error.",
+            inputSchema=_batch_schema(single["download_data"], "References to download, each with the download_data arguments")
+        ),
+    ]
+    return tools
+
+
+@functools.lru_cache(maxsize=1)
+def _build_validators() -> Dict[str, Any]:
+    """Compile one JSON schema validator per tool, keyed by tool name.
+
+    ``jsonschema.validate`` re-checks the schema and builds a new validator
+    on every call; compiling them once keeps that work off each tool call.
+    Settings only change schema defaults and descriptions, which validation
+    ignores, so one set of validators serves every tool list.
+    """
+    validators = {}
+    for tool in _build_tools():
+        validator_cls = jsonschema.validators.validator_for(tool.inputSchema)
+        validator_cls.check_schema(tool.inputSchema)
+        validators[tool.name] = validator_cls(tool.inputSchema)
+    return validators
+
+
+# Integer arguments that clients often send as JSON strings, per tool
+_COERCERS: Dict[str, Dict[str, Callable[[str], Any]]] = {
+    "purchase_stamp": {"amount": int, "depth": int},
+    "extend_stamp": {"amount": int},
+}
+
+
+def coerce_tool_arguments(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert numeric strings to ints for a tool's integer arguments.
+
+    Batch tools apply their single tool's conversions to every item. Values
+    that cannot be converted are left as-is for schema validation to reject.
+
+    Args:
+        name: Tool name
+        arguments: Arguments supplied by the client
+
+    Returns:
+        The arguments, copied only if something was converted
+    """
+    if name.endswith("_batch") and isinstance(arguments.get("items"), list):
+        item_tool = name[:-len("_batch")]
+        if item_tool in _COERCERS:
+            items = [
+                coerce_tool_arguments(item_tool, item) if isinstance(item, dict) else item
+                for item in arguments["items"]
+            ]
+            return {**arguments, "items": items}
+        return arguments
+
+    coerced = None
+    for key, convert in _COERCERS.get(name, {}).items():
+        value = arguments.get(key)
+        if not isinstance(value, str):
+            continue
+        try:
+            converted = convert(value)
+        except ValueError:
+            continue
+        if coerced is None:
+            coerced = dict(arguments)
+        coerced[key] = converted
+    return coerced if coerced is not None else arguments
+
+
+def validate_tool_arguments(name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Validate tool arguments against the tool's input schema.
+
+    Args:
+        name: Tool name
+        arguments: Arguments supplied by the client
+
+    Returns:
+        The validation error message, or None if the arguments are valid
+        or the tool is unknown
+    """
+    validator = _build_validators().get(name)
+    if validator is None:
+        return None
+    error = best_match(validator.iter_errors(arguments))
+    return error.message if error is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _error_result(text: str) -> CallToolResult:
+    """Build an error result, reusing it for repeated messages.
+
+    Clients retrying the same malformed call get the same message each time,
+    so the result objects are shared. The MCP server only serialises them;
+    callers must not mutate the returned result.
+
+    Args:
+        text: Error message shown to the client
+
+    Returns:
+        CallToolResult flagged as an error
+    """
+    return CallToolResult(
+        content=[TextContent(type="text", text=text)],
+        isError=True
+    )
 
 
 def create_server() -> Server:
     """Create and configure the MCP server."""
+    settings = get_settings()
     server = Server(settings.mcp_server_name)
 
     @server.list_tools()
     async def list_tools() -> List[Tool]:
         """List available tools for stamp management."""
-        return [
-            Tool(
-                name="purchase_stamp",
-                description="Purchase a new Swarm postage stamp. Returns a 64-character hexadecimal batch ID (without 0x prefix) that can be used for uploading data to Swarm. AGENT GUIDANCE: Celebrate the success and provide next steps. Emphasize that it takes ~1 minute for stamp info to be available on blockchain. Suggest using it for only one file upload (max 4KB), then purchase another stamp for the next upload.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "amount": {
-                            "type": "integer",
-                            "description": f"Amount of the stamp in wei. Higher amounts provide longer TTL (time-to-live) before stamp expires (default: {settings.default_stamp_amount})",
-                            "default": settings.default_stamp_amount,
-                            "minimum": 1000000
-                        },
-                        "depth": {
-                            "type": "integer",
-                            "description": f"Depth of the stamp (16-24). Depth determines storage capacity - higher depth allows storing more chunks (default: {settings.default_stamp_depth})",
-                            "default": settings.default_stamp_depth,
-                            "minimum": 16,
-                            "maximum": 24
-                        },
-                        "label": {
-                            "type": "string",
-                            "description": "Optional human-readable label for easier stamp identification",
-                            "maxLength": 100
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="get_stamp_status",
-                description="Get detailed information about a specific stamp including TTL, expiration time, utilization, and usability status. Essential for checking if a stamp is still valid for uploads. AGENT GUIDANCE: Present results with expiration time and usability status highlighted. If stamp is near expiration or unusable, emphasize this to the user.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "stamp_id": {
-                            "type": "string",
-                            "description": "The 64-character hexadecimal batch ID of the stamp (without 0x prefix). Example: a1b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789a",
-                            "pattern": "^[a-fA-F0-9]{64}$"
-                        }
-                    },
-                    "required": ["stamp_id"]
-                }
-            ),
-            Tool(
-                name="list_stamps",
-                description="List all available postage stamps with their details including batch IDs, amounts, depths, TTL, expiration times, and utilization. Shows both local stamps (owned by this node) and network stamps. AGENT GUIDANCE: Present as a table with columns: Batch ID, Expiration Time, Status. Do not categorize or give recommendations. Note that this might return a long list and may be removed in future versions.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="extend_stamp",
-                description="Extend an existing stamp with additional funds to increase its TTL (time-to-live). This extends the expiration date but does NOT increase storage capacity. The stamp must be owned by this node. AGENT GUIDANCE: Show before/after comparison if possible. Note that extension info takes time to propagate through blockchain - suggest user to check stamp status again in ~1 minute to see new expiration time.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "stamp_id": {
-                            "type": "string",
-                            "description": "The 64-character hexadecimal batch ID of the stamp to extend (without 0x prefix). Example: a1b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789a",
-                            "pattern": "^[a-fA-F0-9]{64}$"
-                        },
-                        "amount": {
-                            "type": "integer",
-                            "description": "Additional amount to add to the stamp in wei. This will extend the stamp's TTL proportionally.",
-                            "minimum": 1000000
-                        }
-                    },
-                    "required": ["stamp_id", "amount"]
-                }
-            ),
-            Tool(
-                name="upload_data",
-                description="Upload data to the Swarm network using a valid postage stamp. Supports files up to 4KB. Validates that the stamp ID exists and is usable before upload. Returns a Swarm reference hash for retrieving the data. AGENT GUIDANCE: Celebrate successful upload and provide retrieval instructions. Show how to copy the reference hash for later data retrieval.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "data": {
-                            "type": "string",
-                            "description": "Data content to upload as a string (max 4096 bytes). Can be JSON, text, or any string data.",
-                            "maxLength": 4096
-                        },
-                        "stamp_id": {
-                            "type": "string",
-                            "description": "64-character hexadecimal batch ID of the postage stamp (without 0x prefix). Example: a1b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789a",
-                            "pattern": "^[a-fA-F0-9]{64}$"
-                        },
-                        "content_type": {
-                            "type": "string",
-                            "description": "MIME type of the content (e.g., application/json, text/plain, image/png)",
-                            "default": "application/json"
-                        }
-                    },
-                    "required": ["data", "stamp_id"]
-                }
-            ),
-            Tool(
-                name="download_data",
-                description="Download data from the Swarm network using a reference hash. Returns the raw data content. For binary data, size and type information is provided instead of content. AGENT GUIDANCE: Present content appropriately - for JSON data, show field names and truncate long fields to one line. For binary data, explain what it is and how to save it.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "reference": {
-                            "type": "string",
-                            "description": "64-character hexadecimal Swarm reference hash (without 0x prefix). Example: b2c3d4e5f6789abcdef0123456789abcdef0123456789abcdef0123456789ab",
-                            "pattern": "^[a-fA-F0-9]{64}$"
-                        }
-                    },
-                    "required": ["reference"]
-                }
-            ),
-            Tool(
-                name="health_check",
-                description="Check gateway and Swarm network connectivity status. Returns gateway URL, response time, and connection status. Useful for troubleshooting connectivity issues. AGENT GUIDANCE: Show simple 'all good' vs 'issues detected' status. If problems found, suggest checking the gateway server at the URL provided.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-        ]
+        return _build_tools()
+
+    # Arguments are checked against the precompiled validators below, so
+    # switch off the framework's per-call jsonschema.validate where it has one
+    if "validate_input" in inspect.signature(server.call_tool).parameters:
+        call_tool_decorator = server.call_tool(validate_input=False)
+    else:
+        call_tool_decorator = server.call_tool()
 
-    @server.call_tool()
+    @call_tool_decorator
     async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
         """Handle tool calls."""
         try:
-            if name == "purchase_stamp":
-                return await handle_purchase_stamp(arguments)
-            elif name == "get_stamp_status":
-                return await handle_get_stamp_status(arguments)
-            elif name == "list_stamps":
-                return await handle_list_stamps(arguments)
-            elif name == "extend_stamp":
-                return await handle_extend_stamp(arguments)
-            elif name == "upload_data":
-                return await handle_upload_data(arguments)
-            elif name == "download_data":
-                return await handle_download_data(arguments)
-            elif name == "health_check":
-                return await handle_health_check(arguments)
-            else:
-                return CallToolResult(
-                    content=[
-                        TextContent(
-                            type="text",
-                            text=f"Unknown tool: {name}"
-                        )
-                    ],
-                    isError=True
-                )
+            arguments = coerce_tool_arguments(name, arguments)
+            validation_error = validate_tool_arguments(name, arguments)
+            if validation_error is not None:
+                return _error_result(f"Input validation error: {validation_error}")
+
+            handler = _HANDLERS.get(name)
+            if handler is None:
+                return _error_result(f"Unknown tool: {name}")
+            return await handler(arguments)
         except Exception as e:
-            logger.error(f"Error in tool {name}: {e}", exc_info=True)
+            # Tracebacks are expensive to format; only include them when debugging
+            logger.error(
+                "Error in tool %s: %s", name, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             return CallToolResult(
                 content=[
                     TextContent(
@@ -301,455 +602,658 @@ def create_server() -> Server:
     return server
 
 
-async def handle_purchase_stamp(arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle stamp purchase requests."""
-    try:
-        amount = arguments.get("amount", settings.default_stamp_amount)
-        depth = arguments.get("depth", settings.default_stamp_depth)
-        label = arguments.get("label")
-
-        # Validate inputs
-        validate_stamp_amount(amount)
-        validate_stamp_depth(depth)
-
-        if label and len(label) > 100:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Error: Label cannot exceed 100 characters")],
-                isError=True
-            )
+def _tool_errors(
+    failure: str, invalid: Optional[str] = "Validation error"
+) -> Callable[[ToolHandler], ToolHandler]:
+    """Turn a handler's expected errors into error results.
 
-        result = gateway_client.purchase_stamp(amount, depth, label)
+    Args:
+        failure: Message prefix for failed gateway requests
+        invalid: Message prefix for invalid input (ValueError), or None to
+            let ValueError propagate to call_tool
 
-        # Check if purchase was actually successful
-        batch_id = result.get('batchID')
-        if not batch_id:
-            error_msg = f"❌ Stamp purchase failed - no stamp ID returned!\n\nGateway response: {result}"
-            logger.error(f"Purchase failed - missing batchID in response: {result}")
+    Returns:
+        Decorator wrapping a tool handler
+    """
+    def decorate(handler: ToolHandler) -> ToolHandler:
+        @functools.wraps(handler)
+        async def wrapper(arguments: Dict[str, Any]) -> CallToolResult:
+            try:
+                return await handler(arguments)
+            except Exception as e:
+                # ValueError is checked first: requests' JSONDecodeError is both
+                if invalid is not None and isinstance(e, ValueError):
+                    error_msg = f"{invalid}: {str(e)}"
+                elif isinstance(e, RequestException):
+                    error_msg = f"{failure}: {str(e)}"
+                else:
+                    raise
+            logger.error(error_msg)
             return CallToolResult(
                 content=[TextContent(type="text", text=error_msg)],
                 isError=True
             )
+        return wrapper
+    return decorate
 
-        response_text = f"🎉 Stamp purchased successfully!\n\n"
-        response_text += f"📋 Your Stamp Details:\n"
-        response_text += f"   Batch ID: `{batch_id}`\n"
-        response_text += f"   Amount: {amount:,} wei\n"
-        response_text += f"   Depth: {depth}\n"
-        if label:
-            response_text += f"   Label: {label}\n"
-        response_text += f"\n✅ Stamp ID: `{batch_id}` (immediately available)\n"
-        response_text += f"⏱️  IMPORTANT: Wait ~1 minute before using this stamp!\n"
-        response_text += f"📋 The stamp info must propagate through the blockchain before it can be used for uploads.\n"
-        response_text += f"💡 Save this Stamp ID (without 0x prefix) and check its status in about 1 minute before uploading."
 
-        return CallToolResult(
-            content=[TextContent(type="text", text=response_text)]
-        )
+@_tool_errors("Failed to purchase stamp")
+async def handle_purchase_stamp(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle stamp purchase requests."""
+    settings = get_settings()
+    amount = arguments.get("amount", settings.default_stamp_amount)
+    depth = arguments.get("depth", settings.default_stamp_depth)
+    label = arguments.get("label")
 
-    except ValueError as e:
-        error_msg = f"Validation error: {str(e)}"
-        logger.error(error_msg)
+    # Validate inputs
+    validate_stamp_amount(amount)
+    validate_stamp_depth(depth)
+
+    if label and len(label) > 100:
         return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
+            content=[TextContent(type="text", text="Error: Label cannot exceed 100 characters")],
             isError=True
         )
-    except RequestException as e:
-        error_msg = f"Failed to purchase stamp: {str(e)}"
-        logger.error(error_msg)
+
+    result = await run_blocking(_get_client().purchase_stamp, amount, depth, label)
+
+    # Check if purchase was actually successful
+    batch_id = result.get('batchID')
+    if not batch_id:
+        error_msg = f"❌ Stamp purchase failed - no stamp ID returned!\n\nGateway response: {result}"
+        logger.error("Purchase failed - missing batchID in response: %s", result)
         return CallToolResult(
             content=[TextContent(type="text", text=error_msg)],
             isError=True
         )
 
-
+    parts = [
+        _PURCHASE_HEADER,
+        f"   Batch ID: `{batch_id}`\n",
+        f"   Amount: {amount:,} wei\n",
+        f"   Depth: {depth}\n",
+    ]
+    if label:
+        parts.append(f"   Label: {label}\n")
+    parts.extend((
+        f"\n✅ Stamp ID: `{batch_id}` (immediately available)\n",
+        f"⏱️  IMPORTANT: Wait ~1 minute before using this stamp!\n",
+        f"📋 The stamp info must propagate through the blockchain before it can be used for uploads.\n",
+        f"💡 Save this Stamp ID (without 0x prefix) and check its status in about 1 minute before uploading.",
+    ))
+
+    response_text = "".join(parts)
+    return CallToolResult(
+        content=[TextContent(type="text", text=response_text)]
+    )
+
+
+@_tool_errors("Failed to get stamp status")
 async def handle_get_stamp_status(arguments: Dict[str, Any]) -> CallToolResult:
     """Handle stamp status requests."""
-    try:
-        stamp_id = arguments.get("stamp_id")
-        if not stamp_id:
-            raise ValueError("Stamp ID is required")
+    stamp_id = arguments.get("stamp_id")
+    if not stamp_id:
+        raise ValueError("Stamp ID is required")
+
+    # Validate and clean stamp ID
+    clean_stamp_id = validate_and_clean_stamp_id(stamp_id)
+
+    result = await run_blocking(_get_client().get_stamp_details, clean_stamp_id)
+
+    parts = [
+        f"Stamp Details for {clean_stamp_id}:\n",
+        f"Amount: {result.get('amount', 'N/A')}\n",
+        f"Depth: {result.get('depth', 'N/A')}\n",
+        f"Bucket Depth: {result.get('bucketDepth', 'N/A')}\n",
+        f"Block Number: {result.get('blockNumber', 'N/A')}\n",
+    ]
+
+    # Enhanced TTL information
+    batch_ttl = result.get('batchTTL', 'N/A')
+    if batch_ttl != 'N/A':
+        parts.append(f"Batch TTL: {batch_ttl:,} seconds ({batch_ttl/86400:.1f} days)\n")
+    else:
+        parts.append(f"Batch TTL: {batch_ttl}\n")
+
+    parts.append(f"Expected Expiration: {result.get('expectedExpiration', 'N/A')}\n")
+
+    # Enhanced usability information
+    usable = result.get('usable', 'N/A')
+    parts.append(f"Usable: {usable}")
+    if usable is False:
+        parts.append(" ⚠️  (Cannot be used for uploads)")
+    elif usable is True:
+        parts.append(" ✅ (Ready for uploads)")
+    parts.append("\n")
+
+    utilization = result.get('utilization', 'N/A')
+    if utilization != 'N/A' and isinstance(utilization, (int, float)):
+        parts.append(f"Utilization: {utilization}%\n")
+    else:
+        parts.append(f"Utilization: {utilization}\n")
+
+    parts.append(f"Immutable: {result.get('immutableFlag', 'N/A')}\n")
+    parts.append(f"Local: {result.get('local', 'N/A')}\n")
+
+    if result.get('label'):
+        parts.append(f"Label: {result['label']}\n")
+
+    response_text = "".join(parts)
+    return CallToolResult(
+        content=[TextContent(type="text", text=response_text)]
+    )
+
+
+@_tool_errors("Failed to list stamps", invalid=None)
+async def handle_list_stamps(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle stamp listing requests."""
+    result = await run_blocking(_get_client().list_stamps)
+    stamps = result.get("stamps", [])
+    total_count = result.get("total_count", 0)
+    as_json = arguments.get("format") == "json"
+
+    # The gateway has no paging or count endpoint, so both are applied here
+    offset = arguments.get("offset", 0)
+    limit = arguments.get("limit")
+    paginated = bool(offset) or limit is not None
+    if paginated:
+        stamps = stamps[offset:None if limit is None else offset + limit]
+
+    if arguments.get("summary"):
+        if as_json:
+            parts = [_dumps({"total_count": total_count})]
+        else:
+            parts = [f"📋 Found {total_count} stamp(s)."]
+    elif as_json:
+        parts = [_dumps({"total_count": total_count, "stamps": stamps})]
+    elif total_count == 0:
+        parts = ["📭 No stamps found.\n\n💡 Use the 'purchase_stamp' tool to create your first stamp!"]
+    else:
+        parts = [
+            f"📋 Found {total_count} stamp(s):\n\n",
+            f"Showing {len(stamps)} stamp(s) starting at offset {offset}.\n\n" if paginated else "",
+            f"PRESENTATION_HINT: Format as table with columns: Batch ID | Expiration Time | Status\n\n",
+            _STAMP_TABLE_HEADER,
+        ]
 
-        # Validate and clean stamp ID
-        clean_stamp_id = validate_and_clean_stamp_id(stamp_id)
+        for stamp in stamps:
+            get = stamp.get
+            batch_id = get('batchID', 'N/A')
+            expiration = get('expectedExpiration', 'N/A')
+            usable = get('usable', 'N/A')
 
-        result = gateway_client.get_stamp_details(clean_stamp_id)
+            # Truncate batch ID for table format
+            display_id = batch_id[:16] + "..." if len(str(batch_id)) > 19 else batch_id
 
-        response_text = f"Stamp Details for {clean_stamp_id}:\n"
-        response_text += f"Amount: {result.get('amount', 'N/A')}\n"
-        response_text += f"Depth: {result.get('depth', 'N/A')}\n"
-        response_text += f"Bucket Depth: {result.get('bucketDepth', 'N/A')}\n"
-        response_text += f"Block Number: {result.get('blockNumber', 'N/A')}\n"
+            # Status with emoji
+            if usable is True:
+                status = _STATUS_USABLE
+            elif usable is False:
+                status = _STATUS_EXPIRED
+            else:
+                status = _STATUS_UNKNOWN
 
-        # Enhanced TTL information
-        batch_ttl = result.get('batchTTL', 'N/A')
-        if batch_ttl != 'N/A':
-            response_text += f"Batch TTL: {batch_ttl:,} seconds ({batch_ttl/86400:.1f} days)\n"
-        else:
-            response_text += f"Batch TTL: {batch_ttl}\n"
-
-        response_text += f"Expected Expiration: {result.get('expectedExpiration', 'N/A')}\n"
-
-        # Enhanced usability information
-        usable = result.get('usable', 'N/A')
-        response_text += f"Usable: {usable}"
-        if usable is False:
-            response_text += " ⚠️  (Cannot be used for uploads)"
-        elif usable is True:
-            response_text += " ✅ (Ready for uploads)"
-        response_text += "\n"
-
-        utilization = result.get('utilization', 'N/A')
-        if utilization != 'N/A' and isinstance(utilization, (int, float)):
-            response_text += f"Utilization: {utilization}%\n"
-        else:
-            response_text += f"Utilization: {utilization}\n"
+            parts.append(_STAMP_ROW(display_id, str(expiration), status))
 
-        response_text += f"Immutable: {result.get('immutableFlag', 'N/A')}\n"
-        response_text += f"Local: {result.get('local', 'N/A')}\n"
+        parts.append(f"\n⚠️  Note: This tool may be removed in future versions due to potentially long lists.")
 
-        if result.get('label'):
-            response_text += f"Label: {result['label']}\n"
+    response_text = "".join(parts)
+    return CallToolResult(
+        content=[TextContent(type="text", text=response_text)]
+    )
 
-        return CallToolResult(
-            content=[TextContent(type="text", text=response_text)]
-        )
 
-    except ValueError as e:
-        error_msg = f"Validation error: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
-    except RequestException as e:
-        error_msg = f"Failed to get stamp status: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
+@_tool_errors("Failed to extend stamp")
+async def handle_extend_stamp(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle stamp extension requests."""
+    stamp_id = arguments.get("stamp_id")
+    amount = arguments.get("amount")
 
+    if not stamp_id:
+        raise ValueError("Stamp ID is required")
+    if not amount:
+        raise ValueError("Amount is required")
 
-async def handle_list_stamps(arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle stamp listing requests."""
-    try:
-        result = gateway_client.list_stamps()
-        stamps = result.get("stamps", [])
-        total_count = result.get("total_count", 0)
+    # Validate inputs
+    clean_stamp_id = validate_and_clean_stamp_id(stamp_id)
+    validate_stamp_amount(amount)
 
-        if total_count == 0:
-            response_text = "📭 No stamps found.\n\n💡 Use the 'purchase_stamp' tool to create your first stamp!"
-        else:
-            response_text = f"📋 Found {total_count} stamp(s):\n\n"
-            response_text += f"PRESENTATION_HINT: Format as table with columns: Batch ID | Expiration Time | Status\n\n"
-
-            # Header for table format
-            response_text += f"{'Batch ID':<20} | {'Expiration':<20} | {'Status':<10}\n"
-            response_text += f"{'-'*20} | {'-'*20} | {'-'*10}\n"
-
-            for stamp in stamps:
-                batch_id = stamp.get('batchID', 'N/A')
-                expiration = stamp.get('expectedExpiration', 'N/A')
-                usable = stamp.get('usable', 'N/A')
-
-                # Truncate batch ID for table format
-                display_id = batch_id[:16] + "..." if len(str(batch_id)) > 19 else batch_id
-
-                # Status with emoji
-                if usable is True:
-                    status = "✅ Usable"
-                elif usable is False:
-                    status = "❌ Expired"
-                else:
-                    status = "❓ Unknown"
+    result = await run_blocking(_get_client().extend_stamp, clean_stamp_id, amount)
 
-                response_text += f"{display_id:<20} | {str(expiration):<20} | {status:<10}\n"
+    batch_id = result.get('batchID', 'N/A')
+    parts = [
+        _EXTEND_HEADER,
+        f"   Batch ID: `{batch_id}`\n",
+        f"   Additional Amount: {amount:,} wei\n",
+        f"   Status: {result.get('message', 'Extended')}\n\n",
+        f"⏱️  Important: Extension info takes ~1 minute to propagate through the blockchain.\n",
+        f"🔍 Check stamp status again in about 1 minute to see the new expiration time.",
+    ]
 
-            response_text += f"\n⚠️  Note: This tool may be removed in future versions due to potentially long lists."
+    response_text = "".join(parts)
+    return CallToolResult(
+        content=[TextContent(type="text", text=response_text)]
+    )
 
-        return CallToolResult(
-            content=[TextContent(type="text", text=response_text)]
-        )
 
-    except RequestException as e:
-        error_msg = f"Failed to list stamps: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
+@_tool_errors("Failed to upload data", invalid="Upload validation error")
+async def handle_upload_data(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle data upload requests."""
+    data = arguments.get("data")
+    stamp_id = arguments.get("stamp_id")
+
+    if not data:
+        raise ValueError("Data cannot be empty")
+    if not stamp_id:
+        raise ValueError("Stamp ID cannot be empty")
+    content_type = arguments.get("content_type", "application/json")
+
+    # Validate inputs; encode once and reuse the bytes for the upload
+    data_bytes = validate_data_size(data)
+    clean_stamp_id = validate_and_clean_stamp_id(stamp_id)
+
+    # Check that the stamp exists on this gateway while the upload is in
+    # flight; the check decides the outcome, so the two requests can overlap.
+    # The check can be turned off with the pre_validate_stamp setting.
+    # Note: Newly purchased stamps may not be immediately available via get_stamp_details
+    # so we'll try to validate but allow upload to proceed if validation fails with 404
+    stamp_validation_failed = False
+    validation_error_msg = ""
+
+    client = _get_client()
+    upload = run_blocking(client.upload_data, data_bytes, clean_stamp_id, content_type)
+    if get_settings().pre_validate_stamp:
+        stamp_details, result = await asyncio.gather(
+            run_blocking(client.get_stamp_details, clean_stamp_id),
+            upload,
+            return_exceptions=True,
         )
+    else:
+        # Pre-validation disabled: the gateway's own upload errors are reported
+        stamp_details, result = None, await upload
+
+    if isinstance(stamp_details, BaseException):
+        # If we can't get stamp details, it might be a timing issue with newly purchased stamps
+        response = getattr(stamp_details, "response", None)
+        if isinstance(stamp_details, RequestException) and response is not None and response.status_code == 404:
+            # Don't fail - the stamp might be newly purchased, so the
+            # gateway's verdict on the upload stands
+            stamp_validation_failed = True
+            validation_error_msg = f"Could not validate stamp {clean_stamp_id} (it may be newly purchased)"
+        elif isinstance(result, BaseException) or not isinstance(stamp_details, Exception):
+            # Neither request went through; other HTTP errors and network
+            # errors from the check are re-raised
+            raise stamp_details
+        else:
+            # The data is already stored, so hand back its reference and
+            # only note that the stamp could not be checked
+            stamp_validation_failed = True
+            validation_error_msg = f"Could not validate stamp {clean_stamp_id}: {stamp_details}"
+    elif stamp_details is not None and not stamp_details.get("usable", False):
+        if not isinstance(result, BaseException):
+            # The upload went through anyway; return its reference so the
+            # stored data stays reachable and isn't uploaded again
+            stamp_validation_failed = True
+            validation_error_msg = (
+                f"Stamp {clean_stamp_id} reports as not usable for uploads. "
+                "Use a different stamp for future uploads."
+            )
+        else:
+            return CallToolResult(
+                content=[TextContent(
+                    type="text",
+                    text=f"Stamp {clean_stamp_id} exists on this gateway but is not usable for uploads. "
+                         f"Please use a different stamp or create a new one with the 'purchase_stamp' tool."
+                )],
+                isError=True
+            )
 
+    if isinstance(result, BaseException):
+        raise result
 
-async def handle_extend_stamp(arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle stamp extension requests."""
-    try:
-        stamp_id = arguments.get("stamp_id")
-        amount = arguments.get("amount")
+    parts = [
+        _UPLOAD_HEADER,
+        f"   Size: {len(data_bytes):,} bytes\n",
+        f"   Content Type: {content_type}\n",
+        f"   Stamp Used: `{clean_stamp_id}`\n\n",
+        f"🔗 Retrieval Information:\n",
+        f"   Reference Hash: `{result['reference']}`\n",
+        f"   💡 Copy this reference hash to download your data later using the 'download_data' tool.",
+    ]
 
-        if not stamp_id:
-            raise ValueError("Stamp ID is required")
-        if not amount:
-            raise ValueError("Amount is required")
+    # Add validation warning if applicable
+    if stamp_validation_failed:
+        parts.append(f"\nNote: {validation_error_msg}")
 
-        # Validate inputs
-        clean_stamp_id = validate_and_clean_stamp_id(stamp_id)
-        validate_stamp_amount(amount)
+    response_text = "".join(parts)
+    return CallToolResult(
+        content=[TextContent(type="text", text=response_text)]
+    )
 
-        result = gateway_client.extend_stamp(clean_stamp_id, amount)
 
-        response_text = f"✅ Stamp extended successfully!\n\n"
-        response_text += f"📋 Extension Details:\n"
-        batch_id = result.get('batchID', 'N/A')
-        response_text += f"   Batch ID: `{batch_id}`\n"
-        response_text += f"   Additional Amount: {amount:,} wei\n"
-        response_text += f"   Status: {result.get('message', 'Extended')}\n\n"
-        response_text += f"⏱️  Important: Extension info takes ~1 minute to propagate through the blockchain.\n"
-        response_text += f"🔍 Check stamp status again in about 1 minute to see the new expiration time."
+# How far into a download to look for NUL bytes before decoding it
+BINARY_SNIFF_BYTES = 4096
 
-        return CallToolResult(
-            content=[TextContent(type="text", text=response_text)]
-        )
 
-    except ValueError as e:
-        error_msg = f"Validation error: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
-    except RequestException as e:
-        error_msg = f"Failed to extend stamp: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
+def _is_probably_binary(data: bytes) -> bool:
+    """Cheaply detect binary payloads: text formats do not contain NUL bytes."""
+    return data.find(b"\x00", 0, BINARY_SNIFF_BYTES) != -1
 
 
-async def handle_upload_data(arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle data upload requests."""
-    try:
-        data = arguments.get("data")
-        stamp_id = arguments.get("stamp_id")
+def _fetch_download(reference: str) -> Tuple[bytes, str, Any]:
+    """Download data and parse it as JSON or text, for use in an executor thread.
 
-        if not data:
-            raise ValueError("Data cannot be empty")
-        if not stamp_id:
-            raise ValueError("Stamp ID cannot be empty")
-        content_type = arguments.get("content_type", "application/json")
+    Doing both in one executor hop keeps the decode of large payloads off
+    the event loop as well as the network read. JSON is parsed straight
+    from the bytes without decoding them to text first.
 
-        # Validate inputs
-        validate_data_size(data)
-        clean_stamp_id = validate_and_clean_stamp_id(stamp_id)
+    Args:
+        reference: Cleaned Swarm reference hash
 
-        # First, check if the stamp exists on this gateway
-        # Note: Newly purchased stamps may not be immediately available via get_stamp_details
-        # so we'll try to validate but allow upload to proceed if validation fails with 404
-        stamp_validation_failed = False
-        validation_error_msg = ""
+    Returns:
+        Tuple of the raw bytes, their kind ("binary", "json" or "text") and
+        the parsed JSON or decoded text (None for binary data)
+    """
+    result_bytes = _get_client().download_data(reference)
+    if _is_probably_binary(result_bytes):
+        return result_bytes, "binary", None
 
-        try:
-            stamp_details = gateway_client.get_stamp_details(clean_stamp_id)
+    try:
+        return result_bytes, "json", loads_json(result_bytes)
+    except ValueError:
+        pass
 
-            # Verify it's a usable stamp
-            if not stamp_details.get("usable", False):
-                return CallToolResult(
-                    content=[TextContent(
-                        type="text",
-                        text=f"Stamp {clean_stamp_id} exists on this gateway but is not usable for uploads. "
-                             f"Please use a different stamp or create a new one with the 'purchase_stamp' tool."
-                    )],
-                    isError=True
-                )
-
-        except RequestException as e:
-            # If we can't get stamp details, it might be a timing issue with newly purchased stamps
-            if hasattr(e, 'response') and e.response is not None:
-                if e.response.status_code == 404:
-                    # Don't immediately fail - the stamp might be newly purchased
-                    # We'll let the upload attempt proceed and let the gateway handle validation
-                    stamp_validation_failed = True
-                    validation_error_msg = f"Could not validate stamp {clean_stamp_id} (it may be newly purchased)"
-                else:
-                    # Other HTTP errors should be re-raised
-                    raise
-            else:
-                # Network errors should be re-raised
-                raise
+    try:
+        return result_bytes, "text", result_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        return result_bytes, "binary", None
 
-        # Proceed with upload if stamp validation passed
-        result = gateway_client.upload_data(data, clean_stamp_id, content_type)
 
-        response_text = f"🎉 Data uploaded successfully to Swarm!\n\n"
-        response_text += f"📄 Upload Details:\n"
-        response_text += f"   Size: {len(data.encode('utf-8')):,} bytes\n"
-        response_text += f"   Content Type: {content_type}\n"
-        response_text += f"   Stamp Used: `{clean_stamp_id}`\n\n"
-        response_text += f"🔗 Retrieval Information:\n"
-        response_text += f"   Reference Hash: `{result['reference']}`\n"
-        response_text += f"   💡 Copy this reference hash to download your data later using the 'download_data' tool."
+@_tool_errors("Failed to download data")
+async def handle_download_data(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle data download requests."""
+    reference = arguments.get("reference")
+    if not reference:
+        raise ValueError("Reference is required")
 
-        # Add validation warning if applicable
-        if stamp_validation_failed:
-            response_text += f"\nNote: {validation_error_msg}"
+    # Validate and clean reference hash
+    clean_reference = validate_and_clean_reference_hash(reference)
 
-        return CallToolResult(
-            content=[TextContent(type="text", text=response_text)]
-        )
+    result_bytes, kind, payload = await run_blocking(_fetch_download, clean_reference)
 
-    except ValueError as e:
-        error_msg = f"Upload validation error: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
-    except RequestException as e:
-        error_msg = f"Failed to upload data: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
+    if kind == "binary":
+        # If not valid UTF-8, show as binary data info
+        parts = [
+            f"📥 Successfully downloaded binary data from `{clean_reference}`\n\n",
+            f"📊 File Information:\n",
+            f"   Size: {len(result_bytes):,} bytes\n",
+            f"   Type: Binary data\n\n",
+            f"💡 This appears to be binary data (images, documents, etc.). To save it, you would need to write the bytes to a file.",
+        ]
+    elif kind == "json":
+        parts = [
+            f"📥 Successfully downloaded JSON data from `{clean_reference}`:\n\n",
+            f"PRESENTATION_HINT: Show field names and truncate long fields to one line\n\n",
+        ]
 
+        # Show JSON structure with field truncation
+        parts.append("📋 JSON Structure:\n")
+        for key, value in payload.items():
+            if isinstance(value, str) and len(value) > 50:
+                truncated_value = value[:47] + "..."
+                parts.append(f"   {key}: \"{truncated_value}\"\n")
+            elif isinstance(value, dict):
+                parts.append(f"   {key}: {{...}} (object with {len(value)} fields)\n")
+            elif isinstance(value, list):
+                parts.append(f"   {key}: [...] (array with {len(value)} items)\n")
+            else:
+                parts.append(f"   {key}: {value}\n")
 
-async def handle_download_data(arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle data download requests."""
-    try:
-        reference = arguments.get("reference")
-        if not reference:
-            raise ValueError("Reference is required")
+        parts.append(f"\n💾 Size: {len(result_bytes):,} bytes")
+    else:
+        # Not JSON, show as text
+        parts = [f"📥 Successfully downloaded text data from `{clean_reference}`:\n\n{payload}"]
 
-        # Validate and clean reference hash
-        clean_reference = validate_and_clean_reference_hash(reference)
+    response_text = "".join(parts)
+    return CallToolResult(
+        content=[TextContent(type="text", text=response_text)]
+    )
 
-        result_bytes = gateway_client.download_data(clean_reference)
 
-        # Try to decode as text, handle JSON appropriately
-        try:
-            result_text = result_bytes.decode('utf-8')
+# Seconds a healthy health_check result is reused before probing again
+HEALTH_CACHE_TTL = 5.0
 
-            # Try to parse as JSON for better presentation
-            try:
-                import json
-                parsed_json = json.loads(result_text)
-
-                response_text = f"📥 Successfully downloaded JSON data from `{clean_reference}`:\n\n"
-                response_text += f"PRESENTATION_HINT: Show field names and truncate long fields to one line\n\n"
-
-                # Show JSON structure with field truncation
-                response_text += "📋 JSON Structure:\n"
-                for key, value in parsed_json.items():
-                    if isinstance(value, str) and len(value) > 50:
-                        truncated_value = value[:47] + "..."
-                        response_text += f"   {key}: \"{truncated_value}\"\n"
-                    elif isinstance(value, dict):
-                        response_text += f"   {key}: {{...}} (object with {len(value)} fields)\n"
-                    elif isinstance(value, list):
-                        response_text += f"   {key}: [...] (array with {len(value)} items)\n"
-                    else:
-                        response_text += f"   {key}: {value}\n"
-
-                response_text += f"\n💾 Size: {len(result_bytes):,} bytes"
-
-            except json.JSONDecodeError:
-                # Not JSON, show as text
-                response_text = f"📥 Successfully downloaded text data from `{clean_reference}`:\n\n{result_text}"
-
-        except UnicodeDecodeError:
-            # If not valid UTF-8, show as binary data info
-            response_text = f"📥 Successfully downloaded binary data from `{clean_reference}`\n\n"
-            response_text += f"📊 File Information:\n"
-            response_text += f"   Size: {len(result_bytes):,} bytes\n"
-            response_text += f"   Type: Binary data\n\n"
-            response_text += f"💡 This appears to be binary data (images, documents, etc.). To save it, you would need to write the bytes to a file."
+# (client, monotonic timestamp, result) of the last healthy health_check
+_health_cache: Optional[Tuple[Any, float, CallToolResult]] = None
 
-        return CallToolResult(
-            content=[TextContent(type="text", text=response_text)]
-        )
 
-    except ValueError as e:
-        error_msg = f"Validation error: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
-    except RequestException as e:
-        error_msg = f"Failed to download data: {str(e)}"
-        logger.error(error_msg)
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True
-        )
+async def handle_health_check(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle health check requests.
 
+    Healthy results are reused for ``HEALTH_CACHE_TTL`` seconds so clients
+    polling the tool do not each cost a gateway round-trip.
+    """
+    global _health_cache
+    client = _get_client()
+    cached = _health_cache
+    if cached is not None and cached[0] is client and time.monotonic() - cached[1] < HEALTH_CACHE_TTL:
+        return cached[2]
 
-async def handle_health_check(arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle health check requests."""
     try:
-        result = gateway_client.health_check()
+        result = await run_blocking(client.health_check)
 
         status = result.get('status', 'unknown')
         gateway_url = result.get('gateway_url', 'N/A')
         response_time = result.get('response_time_ms', 'N/A')
 
         if status == 'healthy':
-            response_text = f"✅ All systems operational!\n\n"
-            response_text += f"🌐 Gateway: {gateway_url}\n"
+            parts = [
+                f"✅ All systems operational!\n\n",
+                f"🌐 Gateway: {gateway_url}\n",
+            ]
             if isinstance(response_time, (int, float)):
-                response_text += f"⚡ Response Time: {response_time:.0f}ms\n"
+                parts.append(f"⚡ Response Time: {response_time:.0f}ms\n")
         else:
-            response_text = f"⚠️  Issues detected!\n\n"
-            response_text += f"Status: {status}\n"
-            response_text += f"Gateway: {gateway_url}\n"
+            parts = [
+                f"⚠️  Issues detected!\n\n",
+                f"Status: {status}\n",
+                f"Gateway: {gateway_url}\n",
+            ]
             if isinstance(response_time, (int, float)):
-                response_text += f"Response Time: {response_time:.0f}ms\n"
+                parts.append(f"Response Time: {response_time:.0f}ms\n")
 
         if result.get('gateway_response'):
-            response_text += f"\n📋 Gateway Response: {result['gateway_response']}"
+            parts.append(f"\n📋 Gateway Response: {result['gateway_response']}")
 
-        return CallToolResult(
+        response_text = "".join(parts)
+        health_result = CallToolResult(
             content=[TextContent(type="text", text=response_text)]
         )
+        if status == 'healthy':
+            _health_cache = (client, time.monotonic(), health_result)
+        return health_result
 
     except RequestException as e:
-        gateway_url = settings.swarm_gateway_url
-        error_msg = f"❌ Connection failed!\n\n"
-        error_msg += f"Error: {str(e)}\n"
-        error_msg += f"Gateway: {gateway_url}\n\n"
-        error_msg += f"🔧 Troubleshooting:\n"
-        error_msg += f"   • Check if the gateway server is running\n"
-        error_msg += f"   • Verify the gateway URL: {gateway_url}\n"
-        error_msg += f"   • Check your internet connection"
-
-        logger.error(f"Health check failed: {str(e)}")
+        gateway_url = get_settings().swarm_gateway_url
+        error_parts = [
+            f"❌ Connection failed!\n\n",
+            f"Error: {str(e)}\n",
+            f"Gateway: {gateway_url}\n\n",
+            f"🔧 Troubleshooting:\n",
+            f"   • Check if the gateway server is running\n",
+            f"   • Verify the gateway URL: {gateway_url}\n",
+            f"   • Check your internet connection",
+        ]
+        error_msg = "".join(error_parts)
+
+        logger.error("Health check failed: %s", e)
+        return CallToolResult(
+            content=[TextContent(type="text", text=error_msg)],
+            isError=True
+        )
+
+
+async def _run_batch(
+    handler: ToolHandler,
+    arguments: Dict[str, Any],
+) -> CallToolResult:
+    """Run a single-item handler over every item of a batch concurrently.
+
+    Each item's gateway call runs in its own executor thread, so a batch
+    costs roughly one round-trip instead of one per item. The result is an
+    error only if every item failed.
+
+    Args:
+        handler: Single-item tool handler
+        arguments: Batch arguments with an ``items`` list
+
+    Returns:
+        One CallToolResult with a section per item, in input order
+    """
+    items = arguments.get("items")
+    if not isinstance(items, list) or not items:
+        error_msg = "Validation error: items must be a non-empty list"
+    elif len(items) > MAX_BATCH_ITEMS:
+        error_msg = f"Validation error: at most {MAX_BATCH_ITEMS} items per batch, got: {len(items)}"
+    else:
+        error_msg = None
+    if error_msg:
+        logger.error(error_msg)
         return CallToolResult(
             content=[TextContent(type="text", text=error_msg)],
             isError=True
         )
 
+    results = await asyncio.gather(
+        *(handler(item) for item in items), return_exceptions=True
+    )
+
+    sections = []
+    failed = 0
+    for index, result in enumerate(results, 1):
+        if isinstance(result, BaseException):
+            ok, text = False, f"Error: {result}"
+        else:
+            ok, text = not result.isError, result.content[0].text
+        failed += not ok
+        sections.append(f"[{index}/{len(items)}] {'✅' if ok else '❌'}\n{text}")
+
+    summary = f"📦 Batch complete: {len(items) - failed} succeeded, {failed} failed"
+    return CallToolResult(
+        content=[TextContent(type="text", text="\n\n".join([summary, *sections]))],
+        isError=failed == len(items)
+    )
+
+
+async def handle_purchase_stamp_batch(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle batched stamp purchase requests."""
+    return await _run_batch(handle_purchase_stamp, arguments)
+
+
+async def handle_get_stamp_status_batch(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle batched stamp status requests."""
+    return await _run_batch(handle_get_stamp_status, arguments)
+
+
+async def handle_extend_stamp_batch(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle batched stamp extension requests."""
+    return await _run_batch(handle_extend_stamp, arguments)
+
+
+async def handle_upload_data_batch(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle batched data upload requests."""
+    return await _run_batch(handle_upload_data, arguments)
+
+
+async def handle_download_data_batch(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle batched data download requests."""
+    return await _run_batch(handle_download_data, arguments)
+
+
+# Tool name -> handler coroutine, looked up once per call_tool request
+_HANDLERS: Dict[str, ToolHandler] = {
+    "purchase_stamp": handle_purchase_stamp,
+    "get_stamp_status": handle_get_stamp_status,
+    "list_stamps": handle_list_stamps,
+    "extend_stamp": handle_extend_stamp,
+    "upload_data": handle_upload_data,
+    "download_data": handle_download_data,
+    "health_check": handle_health_check,
+    "purchase_stamp_batch": handle_purchase_stamp_batch,
+    "get_stamp_status_batch": handle_get_stamp_status_batch,
+    "extend_stamp_batch": handle_extend_stamp_batch,
+    "upload_data_batch": handle_upload_data_batch,
+    "download_data_batch": handle_download_data_batch,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _initialization_options() -> InitializationOptions:
+    """Build the server's initialization options once per process."""
+    settings = get_settings()
+    return InitializationOptions(
+        server_name=settings.mcp_server_name,
+        server_version=settings.mcp_server_version,
+        capabilities={}
+    )
+
+
+def _start_log_listener() -> Optional[QueueListener]:
+    """Route log records through a queue drained by a background thread.
+
+    Loggers only enqueue records, so writing to stderr never blocks the event
+    loop serving the stdio transport. Like ``logging.basicConfig`` this does
+    nothing if the root logger already has handlers.
+
+    Returns:
+        The started listener, or None if logging was already configured
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
 
 async def main():
     """Main entry point for the MCP server."""
+    log_listener = _start_log_listener()
+    settings = get_settings()
     server = create_server()
 
+    # Python 3.12+: tasks that finish without suspending (validation errors,
+    # cached results) run inline instead of waiting for a scheduler pass.
+    # Only stock asyncio loops; uvloop's create_task is not compatible.
+    loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory") and isinstance(loop, asyncio.BaseEventLoop):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     # Set up cleanup
     def cleanup():
         logger.info("Shutting down MCP server...")
-        gateway_client.close()
+        # Nothing to close if no tool ever needed the gateway
+        if gateway_client is not None:
+            gateway_client.close()
+        if log_listener is not None:
+            # Flushes any queued records before returning
+            log_listener.stop()
 
     try:
         async with stdio_server() as (read_stream, write_stream):
-            logger.info(f"Starting {settings.mcp_server_name} v{settings.mcp_server_version}")
-            logger.info(f"Gateway URL: {settings.swarm_gateway_url}")
+            logger.info("Starting %s v%s", settings.mcp_server_name, settings.mcp_server_version)
+            logger.info("Gateway URL: %s", settings.swarm_gateway_url)
             await server.run(
                 read_stream,
                 write_stream,
-                InitializationOptions(
-                    server_name=settings.mcp_server_name,
-                    server_version=settings.mcp_server_version,
-                    capabilities={}
-                )
+                _initialization_options()
             )
     except KeyboardInterrupt:
         logger.info("Received interrupt signal")
@@ -758,9 +1262,19 @@ async def main():
 
 
 def main_sync():
-    """Synchronous entry point for CLI script."""
-    asyncio.run(main())
+    """Synchronous entry point for CLI script.
+
+    Runs on uvloop, which lowers the per-message overhead of the stdio
+    transport. uvloop is not installed on Windows, so stock asyncio is used
+    there instead.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main_sync()
\ No newline at end of file
@@ -4,7 +4,7 @@ import pytest
 import requests_mock
 from requests.exceptions import RequestException
 
-from swarm_provenance_mcp.gateway_client import SwarmGatewayClient
+from swarm_provenance_mcp.gateway_client import SwarmGatewayClient, get_gateway_client
 
 
 class TestSwarmGatewayClient:
@@ -124,6 +124,50 @@ class TestSwarmGatewayClient:
             with pytest.raises(RequestException):
                 self.client.list_stamps()
 
+    def test_invalid_json_raises_request_exception(self):
+        """Test that malformed gateway JSON surfaces as a RequestException."""
+        stamp_id = "test-stamp-id"
+        with requests_mock.Mocker() as m:
+            m.get(f"{self.base_url}/api/v1/stamps/{stamp_id}", text="not json")
+
+            with pytest.raises(RequestException):
+                self.client.get_stamp_details(stamp_id)
+
+    def test_wide_integer_amount_stays_exact(self):
+        """Test that stamp amounts wider than 64 bits decode as exact ints."""
+        stamp_id = "test-stamp-id"
+        amount = 2**64 * 10 + 1
+        with requests_mock.Mocker() as m:
+            m.get(
+                f"{self.base_url}/api/v1/stamps/{stamp_id}",
+                text=f'{{"batchID": "{stamp_id}", "amount": {amount}}}',
+            )
+
+            result = self.client.get_stamp_details(stamp_id)
+
+        assert isinstance(result["amount"], int)
+        assert result["amount"] == amount
+
+    def test_empty_body_decodes_to_empty_dict(self):
+        """Test that an empty successful response decodes to an empty dict."""
+        stamp_id = "test-stamp-id"
+        with requests_mock.Mocker() as m:
+            m.get(f"{self.base_url}/api/v1/stamps/{stamp_id}", text="")
+
+            assert self.client.get_stamp_details(stamp_id) == {}
+
+    def test_download_data_stream(self):
+        """Test that downloads can be consumed in chunks."""
+        reference = "test-reference"
+        payload = b"x" * 10 + b"y" * 5
+        with requests_mock.Mocker() as m:
+            m.get(f"{self.base_url}/api/v1/data/{reference}", content=payload)
+
+            chunks = list(self.client.download_data_stream(reference, chunk_size=10))
+
+            assert chunks == [b"x" * 10, b"y" * 5]
+            assert self.client.download_data(reference) == payload
+
     def test_custom_headers(self):
         """Test that custom headers are set correctly."""
         with requests_mock.Mocker() as m:
@@ -135,4 +179,61 @@ class TestSwarmGatewayClient:
             assert "Content-Type" in request_headers
             assert request_headers["Content-Type"] == "application/json"
             assert "User-Agent" in request_headers
-            assert "swarm-provenance-mcp" in request_headers["User-Agent"]
\ No newline at end of file
+            assert "swarm-provenance-mcp" in request_headers["User-Agent"]
+
+    def test_default_headers_built_once(self):
+        """Test that clients share one prebuilt copy of the default headers."""
+        from swarm_provenance_mcp.gateway_client import default_headers
+
+        assert default_headers() is default_headers()
+        other = SwarmGatewayClient(self.base_url)
+        assert other.session.headers["User-Agent"] == self.client.session.headers["User-Agent"]
+
+    def test_upload_data_keeps_session_headers(self):
+        """Test that multipart uploads don't mutate the shared session headers."""
+        with requests_mock.Mocker() as m:
+            m.post(f"{self.base_url}/api/v1/data/", json={"reference": "ref-123"})
+
+            result = self.client.upload_data('{"key": "value"}', "stamp-id")
+
+            assert result == {"reference": "ref-123"}
+            assert m.last_request.headers["Content-Type"].startswith("multipart/form-data")
+            assert self.client.session.headers["Content-Type"] == "application/json"
+
+    def test_upload_data_accepts_bytes(self):
+        """Test that pre-encoded payloads are sent as-is."""
+        payload = '{"emoji": "🚀"}'.encode('utf-8')
+        with requests_mock.Mocker() as m:
+            m.post(f"{self.base_url}/api/v1/data/", json={"reference": "ref-456"})
+
+            result = self.client.upload_data(payload, "stamp-id")
+
+            assert result == {"reference": "ref-456"}
+            assert payload in m.last_request.body
+
+    def test_upload_data_bytes_size_limit(self):
+        """Test that the 4KB limit also applies to bytes payloads."""
+        with pytest.raises(ValueError, match="exceeds 4KB limit"):
+            self.client.upload_data(b"x" * 4097, "stamp-id")
+
+    def test_session_uses_pooled_adapter(self):
+        """Test that both schemes share a keep-alive connection pool."""
+        http_adapter = self.client.session.get_adapter("http://example.com")
+        https_adapter = self.client.session.get_adapter("https://example.com")
+
+        assert http_adapter is https_adapter
+
+
+    def test_retry_policy_only_replays_reads(self):
+        """Test that transient 5xx retries never replay spending requests."""
+        retry = self.client.session.get_adapter(self.base_url).max_retries
+
+        assert retry.total == 3
+        assert 503 in retry.status_forcelist
+        assert "GET" in retry.allowed_methods
+        assert "POST" not in retry.allowed_methods
+        assert "PATCH" not in retry.allowed_methods
+
+def test_get_gateway_client_is_shared():
+    """Test that the cached accessor always hands out the same client."""
+    assert get_gateway_client() is get_gateway_client()
@@ -94,6 +94,47 @@ class TestMCPFrameworkCompatibility:
         assert server is not None
         assert hasattr(server, 'request_handlers')
 
+    def test_initialization_options_cached(self):
+        """Test that initialization options are built once from settings."""
+        from swarm_provenance_mcp.server import _initialization_options
+
+        options = _initialization_options()
+        assert options is _initialization_options()
+        assert options.server_name == settings.mcp_server_name
+        assert options.server_version == settings.mcp_server_version
+
+    def test_log_listener_writes_queued_records(self, capsys):
+        """Test that server logging goes through the queue listener to stderr."""
+        import logging
+        from swarm_provenance_mcp.server import _start_log_listener
+
+        root = logging.getLogger()
+        with patch.object(root, "handlers", []), patch.object(root, "level", root.level):
+            listener = _start_log_listener()
+            assert listener is not None
+            logging.getLogger("swarm_provenance_mcp.server").info("queued %s", "record")
+            listener.stop()
+
+            # Already configured: leave the existing handlers alone
+            assert _start_log_listener() is None
+
+        assert "INFO:swarm_provenance_mcp.server:queued record" in capsys.readouterr().err
+
+    def test_main_sync_prefers_uvloop(self):
+        """Test that the CLI entry point runs on uvloop when it is installed."""
+        uvloop = pytest.importorskip("uvloop")
+        from swarm_provenance_mcp import server as server_module
+
+        loops = []
+
+        async def fake_main():
+            loops.append(asyncio.get_running_loop())
+
+        with patch.object(server_module, "main", fake_main):
+            server_module.main_sync()
+
+        assert isinstance(loops[0], uvloop.Loop)
+
     async def test_tool_definitions_format_stable(self):
         """Test that tool definitions maintain expected structure."""
         from swarm_provenance_mcp.server import create_server
@@ -207,6 +248,13 @@ class TestConfigurationStability:
         assert settings.swarm_gateway_url.startswith('http'), "Gateway URL should be HTTP(S)"
         assert '.' in settings.mcp_server_version, "Version should have format like x.y.z"
 
+    def test_settings_loaded_once(self):
+        """Test that settings are cached and the legacy attribute still resolves."""
+        from swarm_provenance_mcp import config
+
+        assert config.get_settings() is config.get_settings()
+        assert config.settings is config.get_settings()
+
 
 class TestErrorHandlingStability:
     """Tests to ensure error handling remains robust."""
@@ -40,7 +40,8 @@ class TestPerformanceBaselines:
             'health_check': {'status': 'healthy', 'response_time_ms': 10}
         }
 
-        with patch('swarm_provenance_mcp.server.gateway_client') as mock_client:
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
             mock_client.purchase_stamp.return_value = mock_responses['purchase_stamp']
             mock_client.list_stamps.return_value = mock_responses['list_stamps']
             mock_client.health_check.return_value = mock_responses['health_check']
@@ -72,6 +73,37 @@ class TestPerformanceBaselines:
         assert init_time < 0.1, f"Gateway client init too slow: {init_time:.3f}s"
         print(f"Gateway client init time: {init_time:.3f}s")
 
+    def test_server_import_does_not_create_gateway_client(self):
+        """Test that importing the server defers creating the gateway client."""
+        import subprocess
+        import sys
+
+        code = (
+            "import swarm_provenance_mcp.server as server\n"
+            "from swarm_provenance_mcp.gateway_client import get_gateway_client\n"
+            "assert get_gateway_client.cache_info().currsize == 0\n"
+            "assert server.gateway_client is None\n"
+            "assert server._get_client() is get_gateway_client()\n"
+            "assert server.gateway_client is get_gateway_client()\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_server_never_constructs_its_own_gateway_client(self):
+        """Test that the server only uses the shared, pooled gateway client."""
+        import ast
+        import inspect
+        from swarm_provenance_mcp import server as server_module
+
+        tree = ast.parse(inspect.getsource(server_module))
+        constructed = [
+            node.lineno for node in ast.walk(tree)
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "SwarmGatewayClient"
+        ]
+        assert not constructed, f"SwarmGatewayClient() constructed at lines {constructed}"
+
     def test_memory_usage_baseline(self):
         """Establish memory usage baseline."""
         process = psutil.Process(os.getpid())
@@ -97,7 +129,8 @@ class TestConcurrencyAndLoad:
         from swarm_provenance_mcp.server import handle_health_check
 
         # Mock to avoid network calls
-        with patch('swarm_provenance_mcp.server.gateway_client') as mock_client:
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
             mock_client.health_check.return_value = {
                 'status': 'healthy',
                 'response_time_ms': 10
@@ -121,6 +154,26 @@ class TestConcurrencyAndLoad:
             assert total_time < 1.0, f"Concurrent operations too slow: {total_time:.2f}s"
             print(f"Concurrent {num_concurrent} operations: {total_time:.3f}s")
 
+    async def test_blocking_gateway_calls_overlap(self):
+        """Test that slow gateway calls don't serialize concurrent handlers."""
+        from swarm_provenance_mcp.server import handle_health_check
+
+        def slow_health_check():
+            time.sleep(0.2)
+            return {'status': 'healthy', 'response_time_ms': 200}
+
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
+            mock_client.health_check.side_effect = slow_health_check
+
+            start_time = time.time()
+            results = await asyncio.gather(*[handle_health_check({}) for _ in range(5)])
+            total_time = time.time() - start_time
+
+            assert all(not result.isError for result in results)
+            # Serial execution would take ~1s; overlapping calls finish in ~0.2s
+            assert total_time < 0.6, f"Gateway calls blocked the event loop: {total_time:.2f}s"
+
     def test_rapid_client_creation_destruction(self):
         """Test that creating/destroying clients rapidly doesn't leak resources."""
         initial_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
@@ -210,7 +263,8 @@ class TestResourceLeakDetection:
         initial_tasks = len([t for t in asyncio.all_tasks() if not t.done()])
 
         # Create many async operations
-        with patch('swarm_provenance_mcp.server.gateway_client') as mock_client:
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
             mock_client.health_check.return_value = {'status': 'healthy'}
 
             tasks = []
@@ -257,7 +311,8 @@ class TestScalabilityLimits:
         """Test that sustained operations remain stable."""
         from swarm_provenance_mcp.server import handle_health_check
 
-        with patch('swarm_provenance_mcp.server.gateway_client') as mock_client:
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
             mock_client.health_check.return_value = {'status': 'healthy'}
 
             # Run many operations to test for memory leaks or performance degradation
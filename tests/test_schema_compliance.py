@@ -132,6 +132,60 @@ class TestMCPToolSchemaCompliance:
                     f"Parameter '{param_name}' has default but is required"
 
 
+    def test_tool_arguments_validated_against_schema(self):
+        """Test that tool arguments are checked with the precompiled validators."""
+        from swarm_provenance_mcp.server import _build_validators, validate_tool_arguments
+
+        assert _build_validators() is _build_validators()
+        assert validate_tool_arguments("get_stamp_status", {"stamp_id": "a" * 64}) is None
+        assert "does not match" in validate_tool_arguments("get_stamp_status", {"stamp_id": "xyz"})
+        assert "'stamp_id' is a required property" in validate_tool_arguments("get_stamp_status", {})
+        assert validate_tool_arguments("unknown_tool", {"anything": 1}) is None
+
+    def test_numeric_string_arguments_coerced(self):
+        """Test that integer arguments sent as strings are converted before validation."""
+        from swarm_provenance_mcp.server import coerce_tool_arguments, validate_tool_arguments
+
+        args = coerce_tool_arguments("purchase_stamp", {"amount": "2000000", "depth": "17"})
+        assert args == {"amount": 2000000, "depth": 17}
+        assert validate_tool_arguments("purchase_stamp", args) is None
+
+        batch = coerce_tool_arguments(
+            "extend_stamp_batch", {"items": [{"stamp_id": "a" * 64, "amount": "2000000"}]}
+        )
+        assert batch["items"][0]["amount"] == 2000000
+
+        # Unconvertible values are left for schema validation to reject
+        bad = {"amount": "lots"}
+        assert coerce_tool_arguments("purchase_stamp", bad) is bad
+        assert validate_tool_arguments("purchase_stamp", bad) is not None
+
+    async def test_call_tool_rejects_invalid_arguments(self):
+        """Test that invalid arguments are rejected before any handler runs."""
+        from mcp.types import CallToolRequest, CallToolRequestParams
+        from unittest.mock import patch
+
+        server = create_server()
+        handler = server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="get_stamp_status", arguments={"stamp_id": "xyz"}),
+        )
+
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
+            result = await handler(request)
+
+        assert result.root.isError
+        assert result.root.content[0].text.startswith("Input validation error:")
+        mock_client.get_stamp_details.assert_not_called()
+
+        # Repeating the same bad call reuses the cached error result
+        with patch('swarm_provenance_mcp.server._get_client'):
+            again = await handler(request)
+        assert again.root is result.root
+
+
 class TestGatewayClientSchemaCompliance:
     """Tests to ensure gateway client method signatures remain compatible."""
 
@@ -193,6 +247,7 @@ class TestProtocolComplianceRegression:
 
     async def test_tool_result_format_compliance(self):
         """Test that tool results follow MCP protocol format."""
+        from unittest.mock import MagicMock
         from swarm_provenance_mcp.server import handle_health_check
         from mcp.types import CallToolResult, TextContent
 
@@ -206,8 +261,8 @@ class TestProtocolComplianceRegression:
                 'gateway_response': {'test': 'data'}
             }
 
-            m.setattr('swarm_provenance_mcp.server.gateway_client.health_check',
-                     lambda: mock_health_result)
+            m.setattr('swarm_provenance_mcp.server._get_client',
+                     lambda: MagicMock(health_check=lambda: mock_health_result))
 
             result = await handle_health_check({})
 
@@ -225,6 +280,33 @@ class TestProtocolComplianceRegression:
                 assert hasattr(content_item, 'text'), "Content must have text attribute"
                 assert content_item.type == 'text', "Content type must be 'text'"
 
+    async def test_unexpected_tool_error_logs_without_traceback(self, caplog):
+        """Test that unexpected tool errors are logged without a traceback outside DEBUG."""
+        import logging
+        from unittest.mock import patch
+        from mcp.types import CallToolRequest, CallToolRequestParams
+        from swarm_provenance_mcp import server as server_module
+
+        async def broken_handler(arguments):
+            raise RuntimeError("boom")
+
+        server = create_server()
+        handler = server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="health_check", arguments={}),
+        )
+
+        with patch.dict(server_module._HANDLERS, {"health_check": broken_handler}):
+            with caplog.at_level(logging.INFO, logger="swarm_provenance_mcp.server"):
+                result = await handler(request)
+
+        assert result.root.isError
+        assert "Error executing health_check: boom" in result.root.content[0].text
+        record = next(r for r in caplog.records if "Error in tool" in r.getMessage())
+        assert record.getMessage() == "Error in tool health_check: boom"
+        assert not record.exc_info
+
     def test_tool_error_format_compliance(self):
         """Test that tool errors follow MCP protocol format."""
         from swarm_provenance_mcp.gateway_client import SwarmGatewayClient
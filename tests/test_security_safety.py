@@ -64,6 +64,28 @@ class TestInputValidationSecurity:
                 for keyword in dangerous_keywords:
                     assert keyword not in error_str, f"Dangerous keyword '{keyword}' in error message"
 
+    def test_hex_identifiers_validated_exactly(self):
+        """Test that stamp IDs and references must be exactly 64 hex characters."""
+        from swarm_provenance_mcp.server import (
+            validate_and_clean_reference_hash,
+            validate_and_clean_stamp_id,
+        )
+
+        assert validate_and_clean_stamp_id("0x" + "a" * 64) == "a" * 64
+        assert validate_and_clean_reference_hash("0X" + "B" * 64) == "B" * 64
+
+        # A trailing newline must not slip past an end-of-string anchor
+        with pytest.raises(ValueError, match="Invalid stamp ID format"):
+            validate_and_clean_stamp_id("a" * 64 + "\n")
+        with pytest.raises(ValueError, match="Invalid reference hash format"):
+            validate_and_clean_reference_hash("g" * 64)
+        with pytest.raises(ValueError, match="Invalid stamp ID format"):
+            validate_and_clean_stamp_id("é" * 64)
+        with pytest.raises(ValueError, match="Invalid stamp ID format"):
+            validate_and_clean_stamp_id("a" * 63)
+        with pytest.raises(ValueError, match="Reference hash cannot be empty"):
+            validate_and_clean_reference_hash("")
+
     def test_reference_hash_validation(self):
         """Test that reference hashes are properly validated."""
         client = SwarmGatewayClient()
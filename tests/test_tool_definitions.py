@@ -135,6 +135,37 @@ class TestToolDefinitions:
                 assert not missing_required, \
                     f"Tool '{tool.name}' missing required parameters: {missing_required}"
 
+    async def test_list_tools_reuses_tool_objects(self, server):
+        """Test that ListTools requests return the same Tool instances every time."""
+        from mcp.types import ListToolsRequest
+        from swarm_provenance_mcp.server import _build_tools
+
+        handler = server.request_handlers[ListToolsRequest]
+        first = await handler(ListToolsRequest(method="tools/list"))
+        second = await handler(ListToolsRequest(method="tools/list"))
+
+        cached = _build_tools()
+        assert len(first.root.tools) == len(cached)
+        for tool, again, expected in zip(first.root.tools, second.root.tools, cached):
+            assert tool is expected
+            assert again is expected
+
+    def test_tool_list_follows_default_settings(self):
+        """Test that the cached tool list is rebuilt when stamp defaults change."""
+        from swarm_provenance_mcp import server as server_module
+        from swarm_provenance_mcp.config import Settings
+
+        tools = server_module._build_tools()
+        custom = Settings(default_stamp_amount=3000000000, default_stamp_depth=18)
+        with patch.object(server_module, "get_settings", return_value=custom):
+            custom_tools = server_module._build_tools()
+
+        assert custom_tools is not tools
+        purchase = next(tool for tool in custom_tools if tool.name == "purchase_stamp")
+        assert purchase.inputSchema["properties"]["amount"]["default"] == 3000000000
+        assert purchase.inputSchema["properties"]["depth"]["default"] == 18
+        assert server_module._build_tools() is tools
+
     def test_gateway_client_method_coverage(self, gateway_client_methods):
         """Test that all gateway client methods have corresponding MCP tools."""
         # Methods that should have MCP tool equivalents
@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import threading
 from unittest.mock import AsyncMock, patch, MagicMock
 from typing import Dict, Any
 
@@ -20,7 +21,8 @@ class TestToolExecution:
     @pytest.fixture
     def mock_gateway_client(self):
         """Mock gateway client for testing tool execution."""
-        with patch('swarm_provenance_mcp.server.gateway_client') as mock_client:
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
             # Configure mock responses for different methods
             mock_client.purchase_stamp.return_value = {
                 "batchID": "test_batch_123",
@@ -70,7 +72,8 @@ class TestToolExecution:
         # Import the handler function directly
         from swarm_provenance_mcp.server import (
             handle_purchase_stamp, handle_get_stamp_status, handle_list_stamps,
-            handle_extend_stamp, handle_upload_data, handle_download_data, handle_health_check
+            handle_extend_stamp, handle_upload_data, handle_download_data, handle_health_check,
+            handle_get_stamp_status_batch, handle_upload_data_batch, handle_download_data_batch
         )
 
         handlers = {
@@ -80,7 +83,10 @@ class TestToolExecution:
             "extend_stamp": handle_extend_stamp,
             "upload_data": handle_upload_data,
             "download_data": handle_download_data,
-            "health_check": handle_health_check
+            "health_check": handle_health_check,
+            "get_stamp_status_batch": handle_get_stamp_status_batch,
+            "upload_data_batch": handle_upload_data_batch,
+            "download_data_batch": handle_download_data_batch
         }
 
         if name in handlers:
@@ -221,6 +227,283 @@ class TestToolExecution:
         assert not result.isError
         mock_gateway_client.download_data.assert_called_once_with("test_reference_abc123")
 
+    async def test_download_binary_data_tool(self, server, mock_gateway_client):
+        """Test that non-UTF-8 downloads are reported as binary data."""
+        mock_gateway_client.download_data.return_value = b"\xff\xfe\x00binary"
+
+        result = await self.call_tool_directly(
+            server, "download_data", {"reference": "a" * 64}
+        )
+
+        assert not result.isError
+        assert "binary data" in result.content[0].text
+        assert "Size: 9 bytes" in result.content[0].text
+
+    async def test_download_nul_bytes_treated_as_binary(self, server, mock_gateway_client):
+        """Test that payloads containing NUL bytes skip text decoding."""
+        # Valid UTF-8, but the NUL byte marks it as binary
+        mock_gateway_client.download_data.return_value = b"PK\x03\x04\x00\x00"
+
+        result = await self.call_tool_directly(
+            server, "download_data", {"reference": "a" * 64}
+        )
+
+        assert not result.isError
+        assert "binary data" in result.content[0].text
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_download_json_and_text_parsing(self, server, mock_gateway_client, use_orjson):
+        """Test that JSON and text downloads render the same with or without orjson."""
+        from swarm_provenance_mcp import gateway_client
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        with patch.object(gateway_client, "orjson", gateway_client.orjson if use_orjson else None):
+            mock_gateway_client.download_data.return_value = '{"name": "café"}'.encode("utf-8")
+            result = await self.call_tool_directly(
+                server, "download_data", {"reference": "a" * 64}
+            )
+            assert "JSON Structure" in result.content[0].text
+            assert "name: café" in result.content[0].text
+
+            mock_gateway_client.download_data.return_value = b"plain text"
+            result = await self.call_tool_directly(
+                server, "download_data", {"reference": "a" * 64}
+            )
+            assert "downloaded text data" in result.content[0].text
+            assert result.content[0].text.endswith("plain text")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_download_json_outside_orjson_range(self, server, mock_gateway_client, use_orjson):
+        """Test that NaN and integers wider than 64 bits still parse exactly."""
+        from swarm_provenance_mcp import gateway_client
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        with patch.object(gateway_client, "orjson", gateway_client.orjson if use_orjson else None):
+            for body, expected in [
+                (b'{"ratio": NaN}', "ratio: nan"),
+                (b'{"amount": 100000000000000000000}', "amount: 100000000000000000000"),
+            ]:
+                mock_gateway_client.download_data.return_value = body
+                result = await self.call_tool_directly(
+                    server, "download_data", {"reference": "a" * 64}
+                )
+                assert "JSON Structure" in result.content[0].text
+                assert expected in result.content[0].text
+
+    async def test_list_stamps_json_format(self, server, mock_gateway_client):
+        """Test that list_stamps can return the stamp records as JSON."""
+        result = await self.call_tool_directly(server, "list_stamps", {"format": "json"})
+
+        assert not result.isError
+        payload = json.loads(result.content[0].text)
+        assert payload["stamps"] == mock_gateway_client.list_stamps.return_value["stamps"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_list_stamps_json_wide_amount(self, server, mock_gateway_client, use_orjson):
+        """Test that JSON output keeps stamp amounts wider than 64 bits exact."""
+        from swarm_provenance_mcp import server as server_module
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        amount = 2**64 * 10 + 1
+        mock_gateway_client.list_stamps.return_value = {
+            "stamps": [{"batchID": "a" * 64, "amount": amount}],
+            "total_count": 1,
+        }
+        with patch.object(server_module, "orjson", server_module.orjson if use_orjson else None):
+            result = await self.call_tool_directly(server, "list_stamps", {"format": "json"})
+
+        assert not result.isError
+        assert json.loads(result.content[0].text)["stamps"][0]["amount"] == amount
+
+    async def test_list_stamps_summary_and_pagination(self, server, mock_gateway_client):
+        """Test that list_stamps can return only the count or a page of stamps."""
+        mock_gateway_client.list_stamps.return_value = {
+            "stamps": [{"batchID": f"batch_{i}", "usable": True} for i in range(5)],
+            "total_count": 5,
+        }
+
+        result = await self.call_tool_directly(server, "list_stamps", {"summary": True})
+        assert result.content[0].text == "📋 Found 5 stamp(s)."
+
+        result = await self.call_tool_directly(
+            server, "list_stamps", {"format": "json", "offset": 1, "limit": 2}
+        )
+        payload = json.loads(result.content[0].text)
+        assert payload["total_count"] == 5
+        assert [s["batchID"] for s in payload["stamps"]] == ["batch_1", "batch_2"]
+
+        result = await self.call_tool_directly(server, "list_stamps", {"offset": 4})
+        text = result.content[0].text
+        assert "Showing 1 stamp(s) starting at offset 4." in text
+        assert "batch_4" in text and "batch_3" not in text
+
+    async def test_upload_data_sends_encoded_bytes(self, server, mock_gateway_client):
+        """Test that upload data is encoded once and the bytes are sent as-is."""
+        mock_gateway_client.get_stamp_details.return_value = {"usable": True}
+
+        result = await self.call_tool_directly(
+            server, "upload_data", {"data": "héllo", "stamp_id": "a" * 64}
+        )
+
+        assert not result.isError
+        sent = mock_gateway_client.upload_data.call_args[0][0]
+        assert sent == "héllo".encode("utf-8")
+        assert "Size: 6 bytes" in result.content[0].text
+
+    async def test_upload_data_overlaps_stamp_check(self, server, mock_gateway_client):
+        """Test that the stamp check and the upload run concurrently."""
+        uploading = threading.Event()
+
+        def get_stamp_details(stamp_id):
+            # Only returns in time if the upload has started alongside the check
+            assert uploading.wait(timeout=5)
+            return {"usable": True}
+
+        def upload_data(*args):
+            uploading.set()
+            return {"reference": "c" * 64}
+
+        mock_gateway_client.get_stamp_details.side_effect = get_stamp_details
+        mock_gateway_client.upload_data.side_effect = upload_data
+
+        result = await self.call_tool_directly(
+            server, "upload_data", {"data": "{}", "stamp_id": "a" * 64}
+        )
+
+        assert not result.isError
+        assert "c" * 64 in result.content[0].text
+
+    async def test_upload_data_unusable_stamp_reported(self, server, mock_gateway_client):
+        """Test that an unusable stamp is reported without losing a stored upload."""
+        import requests
+
+        mock_gateway_client.get_stamp_details.return_value = {"usable": False}
+        mock_gateway_client.upload_data.return_value = {"reference": "c" * 64}
+
+        result = await self.call_tool_directly(
+            server, "upload_data", {"data": "{}", "stamp_id": "a" * 64}
+        )
+
+        assert not result.isError
+        assert "c" * 64 in result.content[0].text
+        assert "Note: Stamp" in result.content[0].text
+        assert "not usable for uploads" in result.content[0].text
+
+        # The error result is only returned when the upload failed as well
+        mock_gateway_client.upload_data.side_effect = requests.HTTPError("400 Client Error")
+        result = await self.call_tool_directly(
+            server, "upload_data", {"data": "{}", "stamp_id": "a" * 64}
+        )
+
+        assert result.isError
+        assert "not usable for uploads" in result.content[0].text
+
+    async def test_upload_data_stamp_check_failure_keeps_reference(self, server, mock_gateway_client):
+        """Test that a failed stamp check doesn't hide a successful upload."""
+        import requests
+
+        response = requests.Response()
+        response.status_code = 500
+        mock_gateway_client.get_stamp_details.side_effect = requests.HTTPError(
+            "500 Server Error", response=response
+        )
+        mock_gateway_client.upload_data.return_value = {"reference": "c" * 64}
+
+        result = await self.call_tool_directly(
+            server, "upload_data", {"data": "{}", "stamp_id": "a" * 64}
+        )
+
+        assert not result.isError
+        assert "c" * 64 in result.content[0].text
+        assert "Note: Could not validate stamp" in result.content[0].text
+
+        # Only when the upload fails too is the stamp check error reported
+        mock_gateway_client.upload_data.side_effect = requests.ConnectionError("refused")
+        result = await self.call_tool_directly(
+            server, "upload_data", {"data": "{}", "stamp_id": "a" * 64}
+        )
+
+        assert result.isError
+        assert "500 Server Error" in result.content[0].text
+
+    async def test_upload_data_without_stamp_pre_validation(self, server, mock_gateway_client):
+        """Test that disabling pre_validate_stamp skips the stamp check."""
+        from swarm_provenance_mcp import server as server_module
+        from swarm_provenance_mcp.config import Settings
+
+        with patch.object(server_module, "get_settings", return_value=Settings(pre_validate_stamp=False)):
+            result = await self.call_tool_directly(
+                server, "upload_data", {"data": "{}", "stamp_id": "a" * 64}
+            )
+
+        assert not result.isError
+        mock_gateway_client.get_stamp_details.assert_not_called()
+        mock_gateway_client.upload_data.assert_called_once()
+
+    async def test_upload_data_batch_tool(self, server, mock_gateway_client):
+        """Test that batched uploads run every item and combine the results."""
+        mock_gateway_client.get_stamp_details.return_value = {"usable": True}
+        items = [
+            {"data": f'{{"n": {i}}}', "stamp_id": "a" * 64} for i in range(3)
+        ]
+
+        result = await self.call_tool_directly(server, "upload_data_batch", {"items": items})
+
+        assert not result.isError
+        text = result.content[0].text
+        assert "3 succeeded, 0 failed" in text
+        assert "[3/3] ✅" in text
+        assert mock_gateway_client.upload_data.call_count == 3
+
+    async def test_batch_tool_reports_partial_failure(self, server, mock_gateway_client):
+        """Test that one bad item does not fail the whole batch."""
+        mock_gateway_client.get_stamp_details.return_value = {"usable": True}
+        items = [{"stamp_id": "a" * 64}, {"stamp_id": "not-hex"}]
+
+        result = await self.call_tool_directly(server, "get_stamp_status_batch", {"items": items})
+
+        assert not result.isError
+        text = result.content[0].text
+        assert "1 succeeded, 1 failed" in text
+        assert "[2/2] ❌" in text
+
+    async def test_batch_tool_rejects_oversized_batch(self, server, mock_gateway_client):
+        """Test that batches above the item limit are rejected up front."""
+        from swarm_provenance_mcp.server import MAX_BATCH_ITEMS
+
+        items = [{"reference": "a" * 64}] * (MAX_BATCH_ITEMS + 1)
+
+        result = await self.call_tool_directly(server, "download_data_batch", {"items": items})
+
+        assert result.isError
+        mock_gateway_client.download_data.assert_not_called()
+
+    async def test_health_check_reuses_recent_healthy_result(self, server, mock_gateway_client):
+        """Test that a healthy result is reused until the cache TTL expires."""
+        from swarm_provenance_mcp import server as server_module
+
+        mock_gateway_client.health_check.return_value = {"status": "healthy"}
+
+        first = await self.call_tool_directly(server, "health_check", {})
+        second = await self.call_tool_directly(server, "health_check", {})
+        assert second is first
+        mock_gateway_client.health_check.assert_called_once()
+
+        with patch.object(server_module, "HEALTH_CACHE_TTL", 0):
+            await self.call_tool_directly(server, "health_check", {})
+        assert mock_gateway_client.health_check.call_count == 2
+
+    async def test_health_check_does_not_cache_issues(self, server, mock_gateway_client):
+        """Test that unhealthy results always probe the gateway again."""
+        mock_gateway_client.health_check.return_value = {"status": "degraded"}
+
+        await self.call_tool_directly(server, "health_check", {})
+        await self.call_tool_directly(server, "health_check", {})
+        assert mock_gateway_client.health_check.call_count == 2
+
     async def test_health_check_tool(self, server, mock_gateway_client):
         """Test health_check tool execution."""
         handler = await self.get_call_tool_handler(server)
@@ -278,7 +561,8 @@ class TestToolExecution:
 
     async def test_gateway_error_handling(self, server):
         """Test error handling when gateway client raises exceptions."""
-        with patch('swarm_provenance_mcp.server.gateway_client') as mock_client:
+        with patch('swarm_provenance_mcp.server._get_client') as get_client:
+            mock_client = get_client.return_value
             mock_client.purchase_stamp.side_effect = Exception("Gateway connection failed")
 
             handler = await self.get_call_tool_handler(server)
@@ -356,7 +640,7 @@ class TestToolParameterValidation:
         handler = await self.get_call_tool_handler(server)
         assert handler is not None
 
-        with patch('swarm_provenance_mcp.server.gateway_client'):
+        with patch('swarm_provenance_mcp.server._get_client'):
             # Test invalid amount type for purchase_stamp
             request = CallToolRequest(
                 name="purchase_stamp",
@@ -375,7 +659,7 @@ class TestToolParameterValidation:
         handler = await self.get_call_tool_handler(server)
         assert handler is not None
 
-        with patch('swarm_provenance_mcp.server.gateway_client'):
+        with patch('swarm_provenance_mcp.server._get_client'):
             # Test negative amount (should be handled gracefully)
             request = CallToolRequest(
                 name="purchase_stamp",
@@ -393,7 +677,7 @@ class TestToolParameterValidation:
         handler = await self.get_call_tool_handler(server)
         assert handler is not None
 
-        with patch('swarm_provenance_mcp.server.gateway_client'):
+        with patch('swarm_provenance_mcp.server._get_client'):
             # Test empty stamp_id
             request = CallToolRequest(
                 name="get_stamp_status",
@@ -73,39 +73,35 @@ class TestToolSynchronization:
         return methods
 
     def extract_tool_handlers(self, server_ast):
-        """Extract tool handler implementations from server source code."""
+        """Extract tool handler implementations from the _HANDLERS dispatch table."""
         handlers = {}
+        functions = {
+            node.name: node for node in ast.walk(server_ast)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
 
-        class HandlerVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.current_tool_name = None
-
-            def visit_If(self, node):
-                # Look for if tool_name == "something" patterns
-                if (isinstance(node.test, ast.Compare) and
-                    len(node.test.comparators) == 1 and
-                    isinstance(node.test.comparators[0], ast.Constant)):
-
-                    # Check if it's comparing tool_name
-                    if (isinstance(node.test.left, ast.Name) and
-                        node.test.left.id == 'tool_name'):
-                        tool_name = node.test.comparators[0].value
-                        handlers[tool_name] = {
-                            'implemented': True,
-                            'has_error_handling': self._has_try_except(node)
-                        }
-
-                self.generic_visit(node)
-
-            def _has_try_except(self, node):
-                """Check if the handler has try/except blocks."""
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Try):
-                        return True
-                return False
+        for node in ast.walk(server_ast):
+            if isinstance(node, ast.AnnAssign):
+                target, value = node.target, node.value
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target, value = node.targets[0], node.value
+            else:
+                continue
+
+            if not (isinstance(target, ast.Name) and target.id == '_HANDLERS'
+                    and isinstance(value, ast.Dict)):
+                continue
+
+            for key, handler in zip(value.keys, value.values):
+                if isinstance(key, ast.Constant) and isinstance(handler, ast.Name):
+                    function = functions.get(handler.id)
+                    handlers[key.value] = {
+                        'implemented': function is not None,
+                        'has_error_handling': function is not None and any(
+                            isinstance(child, ast.Try) for child in ast.walk(function)
+                        )
+                    }
 
-        visitor = HandlerVisitor()
-        visitor.visit(server_ast)
         return handlers
 
     def test_tool_definitions_exist_in_source(self, server_source_code):